@@ -0,0 +1,67 @@
+"""
+Admin routes module.
+
+Defines operational routes served next to the playground API, such as retrieval of
+captured request profiles, model hedging statistics, connection pool metrics and code
+index statistics.
+"""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import FileResponse, PlainTextResponse
+
+from .agents.technical import code_index
+from .config.settings import admin_token, profiling_dir, profiling_keep
+from .models import client_provider, hedge_registry
+from .profiling import ProfileStore
+
+profile_store = ProfileStore(profiling_dir, keep=profiling_keep)
+
+
+def require_admin_token(x_admin_token: Optional[str] = Header(None)) -> None:
+    """Reject the request unless it carries the configured admin token."""
+    if admin_token and x_admin_token != admin_token:
+        raise HTTPException(status_code=401, detail="Invalid admin token")
+
+
+admin_router = APIRouter(prefix="/v1/admin", tags=["Admin"], dependencies=[Depends(require_admin_token)])
+
+
+@admin_router.get("/profiles")
+def list_profiles():
+    """List the stored request profiles, newest first."""
+    return profile_store.list()
+
+
+@admin_router.get("/profiles/{profile_id}")
+def get_profile(profile_id: str, format: str = "text", sort: str = "cumulative", limit: int = 50):
+    """Return a stored profile as a pstats report, or as the raw ``.prof`` file with ``format=raw``."""
+    if format == "raw":
+        path = profile_store.path(profile_id)
+        if path is None:
+            raise HTTPException(status_code=404, detail="Profile not found")
+        return FileResponse(path, media_type="application/octet-stream", filename=path.name)
+
+    summary = profile_store.summary(profile_id, sort=sort, limit=limit)
+    if summary is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return PlainTextResponse(summary)
+
+
+@admin_router.get("/hedging")
+def get_hedging_stats():
+    """Per-step model latency percentiles, hedge rates, hedge wins and deadline timeouts."""
+    return hedge_registry.snapshot()
+
+
+@admin_router.get("/http-pool")
+def get_http_pool_stats():
+    """Shared model connection pool limits and connection-reuse metrics."""
+    return client_provider.snapshot()
+
+
+@admin_router.get("/code-index")
+def get_code_index_stats():
+    """Code index size and the duration and files per second of its last indexing pass."""
+    return code_index.status()
@@ -9,6 +9,7 @@ between standalone agents and team/workflow-specific agents.
 # Standalone agents - directly exposed in the playground UI
 # =========================================================
 from .generic import web_agent, finance_agent
+from .technical import code_assistant
 
 # ======================================================
 # Team/workflow-specific agents - not directly exposed
@@ -29,6 +30,7 @@ __all__ = [
     # Standalone agents
     "web_agent",
     "finance_agent",
+    "code_assistant",
 ]
 
 # These are explicitly NOT included in __all__ since they shouldn't be imported directly by app.py
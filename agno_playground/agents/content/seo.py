@@ -6,15 +6,15 @@ Defines the SEO specialist agent for optimizing content for search engines.
 from textwrap import dedent
 
 from agno.agent import Agent
-from agno.models.openai import OpenAIChat
 from agno.storage.sqlite import SqliteStorage
 from agno.tools.duckduckgo import DuckDuckGoTools
 
 from ...config.settings import agent_storage
+from ...models import hedged_chat
 
 seo_specialist = Agent(
     name="SEO Specialist",
-    model=OpenAIChat(id="gpt-4o"),
+    model=hedged_chat("content.seo_specialist"),
     tools=[DuckDuckGoTools()],
     description=dedent("""\
     You are an SEO specialist who optimizes content to improve search engine 
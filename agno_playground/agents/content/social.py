@@ -6,15 +6,15 @@ Defines the social media manager agent for creating and managing social media co
 from textwrap import dedent
 
 from agno.agent import Agent
-from agno.models.openai import OpenAIChat
 from agno.storage.sqlite import SqliteStorage
 from agno.tools.duckduckgo import DuckDuckGoTools
 
 from ...config.settings import agent_storage
+from ...models import hedged_chat
 
 social_media_manager = Agent(
     name="Social Media Manager",
-    model=OpenAIChat(id="gpt-4o"),
+    model=hedged_chat("content.social_media_manager"),
     tools=[DuckDuckGoTools()],
     description=dedent("""\
     You are a social media expert who creates platform-optimized content
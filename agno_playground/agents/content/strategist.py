@@ -6,15 +6,15 @@ Defines the content strategist agent for developing content strategies.
 from textwrap import dedent
 
 from agno.agent import Agent
-from agno.models.openai import OpenAIChat
 from agno.storage.sqlite import SqliteStorage
 from agno.tools.duckduckgo import DuckDuckGoTools
 
 from ...config.settings import agent_storage
+from ...models import hedged_chat
 
 content_strategist = Agent(
     name="Content Strategist",
-    model=OpenAIChat(id="gpt-4o"),
+    model=hedged_chat("content.content_strategist"),
     tools=[DuckDuckGoTools()],
     description=dedent("""\
     You are a content strategist who excels at developing content strategies 
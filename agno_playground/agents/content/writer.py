@@ -6,14 +6,14 @@ Defines the content writer agent for creating various types of content.
 from textwrap import dedent
 
 from agno.agent import Agent
-from agno.models.openai import OpenAIChat
 from agno.storage.sqlite import SqliteStorage
 
 from ...config.settings import agent_storage
+from ...models import hedged_chat
 
 content_writer = Agent(
     name="Content Writer",
-    model=OpenAIChat(id="gpt-4o"),
+    model=hedged_chat("content.content_writer"),
     description=dedent("""\
     You are a versatile content writer who creates engaging, clear, and effective content
     across various formats and for different audience segments.
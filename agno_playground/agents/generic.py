@@ -6,16 +6,16 @@ These agents can be used independently or as part of teams and workflows.
 """
 
 from agno.agent import Agent
-from agno.models.openai import OpenAIChat
 from agno.storage.sqlite import SqliteStorage
 from agno.tools.duckduckgo import DuckDuckGoTools
 from agno.tools.yfinance import YFinanceTools
 
 from ..config.settings import agent_storage
+from ..models import chat_model
 
 web_agent = Agent(
     name="Web Agent",
-    model=OpenAIChat(id="gpt-4o"),
+    model=chat_model("gpt-4o"),
     tools=[DuckDuckGoTools()],
     instructions=["Always include sources"],
     storage=SqliteStorage(table_name="web_agent", db_file=agent_storage),
@@ -27,7 +27,7 @@ web_agent = Agent(
 
 finance_agent = Agent(
     name="Finance Agent",
-    model=OpenAIChat(id="gpt-4o"),
+    model=chat_model("gpt-4o"),
     tools=[YFinanceTools(stock_price=True, analyst_recommendations=True, company_info=True, company_news=True)],
     instructions=["Always use tables to display data"],
     storage=SqliteStorage(table_name="finance_agent", db_file=agent_storage),
@@ -4,15 +4,15 @@ Defines the market researcher agent for gathering and analyzing market intellige
 """
 
 from agno.agent import Agent
-from agno.models.openai import OpenAIChat
 from agno.storage.sqlite import SqliteStorage
 from agno.tools.duckduckgo import DuckDuckGoTools
 
 from ...config.settings import agent_storage
+from ...models import hedged_chat
 
 market_researcher = Agent(
     name="Market Researcher",
-    model=OpenAIChat(id="gpt-4o"),
+    model=hedged_chat("marketing.market_researcher"),
     tools=[DuckDuckGoTools()],
     description="You are a market researcher who gathers and analyzes market intelligence.",
     instructions=[
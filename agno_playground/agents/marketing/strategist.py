@@ -4,15 +4,15 @@ Defines the marketing strategist agent for developing marketing strategies.
 """
 
 from agno.agent import Agent
-from agno.models.openai import OpenAIChat
 from agno.storage.sqlite import SqliteStorage
 from agno.tools.duckduckgo import DuckDuckGoTools
 
 from ...config.settings import agent_storage
+from ...models import hedged_chat
 
 marketing_strategist = Agent(
     name="Marketing Strategist",
-    model=OpenAIChat(id="gpt-4o"),
+    model=hedged_chat("marketing.marketing_strategist"),
     tools=[DuckDuckGoTools()],
     description="You are a marketing strategist who develops comprehensive marketing plans.",
     instructions=[
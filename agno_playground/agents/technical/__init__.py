@@ -5,6 +5,6 @@ This package contains agents focused on technical skills like programming,
 system administration, and data analysis.
 """
 
-from .code import code_assistant
+from .code import code_assistant, code_index
 
-__all__ = ["code_assistant"]
+__all__ = ["code_assistant", "code_index"]
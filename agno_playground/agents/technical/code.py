@@ -5,17 +5,23 @@ This module defines a programming assistant agent that helps with code-related t
 """
 
 from agno.agent import Agent
-from agno.models.openai import OpenAIChat
+from agno.storage.sqlite import SqliteStorage
 from agno.tools.duckduckgo import DuckDuckGoTools
 from textwrap import dedent
 
-from ...config.settings import agent_storage
+from ...config.settings import agent_storage, code_index_max_file_bytes, code_index_root, code_index_watch
+from ...knowledge import CodeIndex
+from ...models import chat_model
+from ...tools import CodeIndexTools
+
+# Local index of the configured repository, built in the background at startup
+code_index = CodeIndex(code_index_root, watch=code_index_watch, max_file_bytes=code_index_max_file_bytes)
 
 # Create a code assistant agent
 code_assistant = Agent(
     name="Code Assistant",
-    model=OpenAIChat(id="gpt-4o"),
-    tools=[DuckDuckGoTools()],
+    model=chat_model("gpt-4o"),
+    tools=[CodeIndexTools(code_index), DuckDuckGoTools()],
     description=dedent("""
     You are a Software Engineer specialized in Software Development.
     You have extensive knowledge and experience in this field.
@@ -29,7 +35,14 @@ code_assistant = Agent(
         "Debug and troubleshoot code issues",
         "Explain programming concepts clearly",
         "Recommend best practices and design patterns",
-        "Assist with code reviews and optimization"
+        "Assist with code reviews and optimization",
+        "Answer questions about our codebase from the code index tools, not from web search",
+        "Locate definitions with find_symbol and text with search_code, then read the relevant lines",
+        "Cite file paths and line numbers for the code you refer to",
+        "Only search the web for external libraries and general programming questions"
     ],
-    storage=agent_storage
+    storage=SqliteStorage(table_name="code_assistant", db_file=agent_storage),
+    add_history_to_messages=True,
+    num_history_responses=5,
+    markdown=True,
 )
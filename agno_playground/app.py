@@ -8,7 +8,8 @@ and workflows defined in the respective packages.
 from agno.playground import Playground
 
 # Import standalone agents - these agents will be directly exposed in the playground
-from .agents import finance_agent, web_agent
+from .agents import code_assistant, finance_agent, web_agent
+from .agents.technical import code_index
 
 # Import workflows
 from .workflows import blog_workflow
@@ -16,17 +17,62 @@ from .workflows import blog_workflow
 # Import teams
 from .teams import content_team, marketing_team
 
+from .admin import admin_router, profile_store
+from .config.settings import (
+    fake_model_enabled,
+    fake_model_latency,
+    fake_model_token_latency,
+    profiling_enabled,
+    profiling_header,
+    profiling_interval,
+    profiling_sample_rate,
+)
+from .profiling import ProfilingMiddleware
+
 # Only include standalone agents in the playground
 # We've decided NOT to expose workflow-specific agents directly in the playground
 standalone_agents = [
     web_agent,      # General-purpose web agent
     finance_agent,  # General-purpose finance agent
+    code_assistant, # Programming assistant backed by the local code index
     # We're excluding blog workflow agents as they're meant to be used within the workflow
 ]
 
+teams = [content_team, marketing_team]
+
+workflows = [blog_workflow]
+
+# Serve everything from the local fake model when running load tests
+if fake_model_enabled:
+    from .benchmarks import FakeOpenAIBackend, install_fake_model
+
+    install_fake_model(
+        agents=standalone_agents,
+        teams=teams,
+        workflows=workflows,
+        backend=FakeOpenAIBackend(latency=fake_model_latency, token_latency=fake_model_token_latency),
+    )
+
 # Create and configure the Playground application
 app = Playground(
     agents=standalone_agents,  # Only expose standalone agents
-    teams=[content_team, marketing_team],
-    workflows=[blog_workflow]
+    teams=teams,
+    workflows=workflows
 ).get_app()
+
+# Build the code index in the background so the first code question does not wait for it
+app.add_event_handler("startup", code_index.start)
+app.add_event_handler("shutdown", code_index.stop)
+
+# Operational routes (profiles, metrics)
+app.include_router(admin_router)
+
+# Opt-in per-request profiling, triggered by header or sampling rate
+if profiling_enabled:
+    app.add_middleware(
+        ProfilingMiddleware,
+        store=profile_store,
+        sample_rate=profiling_sample_rate,
+        header=profiling_header,
+        interval=profiling_interval,
+    )
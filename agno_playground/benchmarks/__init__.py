@@ -0,0 +1,10 @@
+"""
+Benchmarks package.
+
+This package contains the local fake model and the load-testing harness used to
+measure the playground application without calling external model providers.
+"""
+
+from .fake_model import FakeOpenAIBackend, install_fake_model
+
+__all__ = ["FakeOpenAIBackend", "install_fake_model"]
@@ -0,0 +1,147 @@
+"""
+Editor benchmark.
+
+Compares the patch and full-rewrite modes of the blog editor step on the same drafts,
+reporting output tokens, latency and patch success per post as JSON. The patch mode cost
+includes the fallback rewrite whenever the edits cannot be applied.
+
+Usage:
+    python -m agno_playground.benchmarks.editor --drafts post1.md post2.md
+    python -m agno_playground.benchmarks.editor --topics "AI in healthcare" --fake
+"""
+
+import argparse
+import contextlib
+import json
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from agno.agent import RunResponse
+
+from ..workflows.blog import BlogEdits, blog_workflow
+from ..workflows.patching import PatchError, apply_edits
+from ..workflows.repair import coerce_structured
+from .fake_model import FakeOpenAIBackend, install_fake_model
+
+DEFAULT_TOPICS = [
+    "How small teams can adopt continuous delivery",
+    "The practical limits of remote work",
+    "What makes a developer tool delightful",
+]
+
+
+def _output_tokens(response: Optional[RunResponse]) -> int:
+    if response is None or not response.metrics:
+        return 0
+    return sum(response.metrics.get("output_tokens", []))
+
+
+def _timed(workflow, agent, prompt: str) -> Dict[str, Any]:
+    start = time.perf_counter()
+    response = workflow.run_step(agent, prompt)
+    return {
+        "response": response,
+        "latency_s": time.perf_counter() - start,
+        "output_tokens": _output_tokens(response),
+    }
+
+
+def benchmark_draft(workflow, draft: str) -> Dict[str, Any]:
+    """Edit one draft in both modes and compare what the workflow pays for editing in each.
+
+    Savings are negative when the patch cannot be applied, since the workflow then pays
+    for the patch call and the rewrite.
+    """
+    patch = _timed(
+        workflow,
+        workflow.patch_editor,
+        f"Edit and refine the following blog post draft:\n\n{draft}\n\n"
+        f"Improve clarity, fix any grammar issues, ensure consistent tone, and enhance readability. "
+        f"Return only the edits, anchored on verbatim spans of the draft.",
+    )
+    rewrite = _timed(
+        workflow,
+        workflow.editor,
+        f"Edit and refine the following blog post draft:\n\n{draft}\n\n"
+        f"Improve clarity, fix any grammar issues, ensure consistent tone, and enhance readability. "
+        f"Maintain the original voice while making the content more engaging and professional.",
+    )
+
+    plan, error = coerce_structured(patch["response"].content if patch["response"] else None, BlogEdits)
+    applied = False
+    if plan is not None:
+        try:
+            apply_edits(draft, plan.edits)
+            applied = True
+        except PatchError as e:
+            error = str(e)
+
+    # In patch mode the workflow pays for the patch call, plus the rewrite when the edits
+    # cannot be applied, so a failed patch costs more than rewriting straight away
+    patch_mode_tokens = patch["output_tokens"] + (0 if applied else rewrite["output_tokens"])
+    patch_mode_latency = patch["latency_s"] + (0.0 if applied else rewrite["latency_s"])
+
+    return {
+        "draft_words": len(draft.split()),
+        "patch": {
+            "output_tokens": patch["output_tokens"],
+            "latency_s": patch["latency_s"],
+            "edits": len(plan.edits) if plan is not None else 0,
+            "applied": applied,
+            "error": None if applied else error,
+        },
+        "rewrite": {"output_tokens": rewrite["output_tokens"], "latency_s": rewrite["latency_s"]},
+        "patch_mode": {"output_tokens": patch_mode_tokens, "latency_s": patch_mode_latency},
+        "output_tokens_saved": rewrite["output_tokens"] - patch_mode_tokens,
+        "latency_saved_s": rewrite["latency_s"] - patch_mode_latency,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark patch-based against full-rewrite editing.")
+    parser.add_argument("--drafts", nargs="*", default=[], help="Markdown drafts to edit")
+    parser.add_argument("--topics", nargs="*", help="Topics to draft with the blog writer when no drafts are given")
+    parser.add_argument("--fake", action="store_true", help="Use the local fake model (checks plumbing only)")
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    # agno logs to stdout, keep stdout for the report
+    with contextlib.redirect_stdout(sys.stderr):
+        if args.fake:
+            # Echoing the prompt makes the rewrite cost grow with the draft, like a real editor
+            install_fake_model(workflows=[blog_workflow], backend=FakeOpenAIBackend(latency=0.05, echo=True))
+
+        drafts = []
+        for path in args.drafts:
+            with open(path) as f:
+                drafts.append(f.read())
+        if not drafts:
+            for topic in args.topics or DEFAULT_TOPICS:
+                response = blog_workflow.run_step(
+                    blog_workflow.blog_writer, f"Write a blog post of about 800 words on: {topic}"
+                )
+                if response and response.content:
+                    drafts.append(response.content)
+
+        posts = [benchmark_draft(blog_workflow, draft) for draft in drafts]
+
+    report = {
+        "posts": posts,
+        "summary": {
+            "posts": len(posts),
+            "patch_success_rate": sum(p["patch"]["applied"] for p in posts) / len(posts) if posts else 0.0,
+            "output_tokens_saved_per_post": sum(p["output_tokens_saved"] for p in posts) / len(posts) if posts else 0.0,
+            "latency_saved_per_post_s": sum(p["latency_saved_s"] for p in posts) / len(posts) if posts else 0.0,
+        },
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
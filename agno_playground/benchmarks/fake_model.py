@@ -0,0 +1,291 @@
+"""
+Fake model module.
+
+Provides an in-process, OpenAI-compatible fake backend so agents, teams and workflows
+can be exercised end to end without network access or API cost.
+"""
+
+import asyncio
+import json
+import re
+import time
+import uuid
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import httpx
+from agno.agent import Agent
+from agno.models.openai import OpenAIChat
+from agno.team import Team
+from agno.workflow import Workflow
+from openai import AsyncOpenAI, OpenAI
+
+FAKE_BASE_URL = "http://fake-openai.local/v1"
+
+_JSON_FIELD_PROPERTIES = re.compile(r"<json_field_properties>\s*(.*?)\s*</json_field_properties>", re.DOTALL)
+
+
+def example_from_schema(schema: Dict[str, Any], defs: Optional[Dict[str, Any]] = None) -> Any:
+    """Build a minimal instance that validates against a JSON schema."""
+    defs = defs if defs is not None else schema.get("$defs", schema.get("definitions", {}))
+
+    if "$ref" in schema:
+        return example_from_schema(defs[schema["$ref"].split("/")[-1]], defs)
+    for key in ("anyOf", "oneOf", "allOf"):
+        if key in schema:
+            options = [option for option in schema[key] if option.get("type") != "null"]
+            return example_from_schema(options[0] if options else {"type": "null"}, defs)
+    if "enum" in schema:
+        return schema["enum"][0]
+    if "const" in schema:
+        return schema["const"]
+
+    schema_type = schema.get("type", "object")
+    if isinstance(schema_type, list):
+        schema_type = next((t for t in schema_type if t != "null"), "null")
+
+    if schema_type == "object":
+        properties = schema.get("properties", {})
+        return {name: example_from_schema(prop, defs) for name, prop in properties.items()}
+    if schema_type == "array":
+        item = example_from_schema(schema.get("items", {"type": "string"}), defs)
+        return [item, item]
+    if schema_type == "string":
+        return schema.get("title", "example")
+    if schema_type == "integer":
+        return 800
+    if schema_type == "number":
+        return 1.0
+    if schema_type == "boolean":
+        return True
+    return None
+
+
+class FakeOpenAIBackend:
+    """An OpenAI chat completions endpoint served through an httpx mock transport.
+
+    Plain-text requests are answered with ``output_tokens`` words of filler, or an echo of
+    the last user message when ``echo`` is set. Structured-output and JSON-mode requests
+    are answered with a minimal instance of the requested JSON schema. Tools are never called.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.05,
+        token_latency: float = 0.002,
+        output_tokens: int = 64,
+        echo: bool = False,
+    ):
+        """
+        Args:
+            latency: Seconds before the first token is produced
+            token_latency: Seconds between generated tokens
+            output_tokens: Number of words in plain-text responses
+            echo: Answer plain-text requests with the last user message
+        """
+        self.latency = latency
+        self.token_latency = token_latency
+        self.output_tokens = output_tokens
+        self.echo = echo
+
+    # ---------------------------------------------------------------------------
+    # Response construction
+    # ---------------------------------------------------------------------------
+
+    @staticmethod
+    def _json_mode_schema(body: Dict[str, Any]) -> Dict[str, Any]:
+        """Rebuild the schema agno describes in the system prompt of JSON-mode requests."""
+        for message in body.get("messages", []):
+            match = _JSON_FIELD_PROPERTIES.search(str(message.get("content", "")))
+            if match is None:
+                continue
+            properties = json.loads(match.group(1))
+            # agno lists nested models by their properties only, enums keep their schema
+            defs = {
+                name: {"type": "object", "properties": definition}
+                if all(isinstance(value, dict) for value in definition.values())
+                else definition
+                for name, definition in properties.pop("$defs", {}).items()
+            }
+            return {"type": "object", "properties": properties, "$defs": defs}
+        return {"type": "object", "properties": {"result": {"type": "string"}}}
+
+    def _content_for(self, body: Dict[str, Any]) -> str:
+        response_format = body.get("response_format") or {}
+        if response_format.get("type") == "json_schema":
+            schema = response_format.get("json_schema", {}).get("schema", {})
+            return json.dumps(example_from_schema(schema))
+        if response_format.get("type") == "json_object":
+            return json.dumps(example_from_schema(self._json_mode_schema(body)))
+
+        if self.echo:
+            user_messages = [m for m in body.get("messages", []) if m.get("role") == "user"]
+            if user_messages:
+                content = user_messages[-1].get("content")
+                if isinstance(content, list):
+                    content = " ".join(part.get("text", "") for part in content if isinstance(part, dict))
+                return str(content)
+        return " ".join(f"token{i}" for i in range(self.output_tokens))
+
+    @staticmethod
+    def _usage(body: Dict[str, Any], content: str) -> Dict[str, int]:
+        prompt_tokens = sum(len(str(m.get("content", "")).split()) for m in body.get("messages", []))
+        completion_tokens = len(content.split())
+        return {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+
+    def _completion(self, body: Dict[str, Any], content: str) -> Dict[str, Any]:
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "fake"),
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": self._usage(body, content),
+        }
+
+    def _chunks(self, body: Dict[str, Any], content: str) -> Iterator[bytes]:
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        base = {
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": body.get("model", "fake"),
+        }
+        words = content.split(" ")
+        for i, word in enumerate(words):
+            delta: Dict[str, Any] = {"content": word if i == 0 else f" {word}"}
+            if i == 0:
+                delta["role"] = "assistant"
+            chunk = {**base, "choices": [{"index": 0, "delta": delta, "finish_reason": None}]}
+            yield f"data: {json.dumps(chunk)}\n\n".encode()
+        final = {**base, "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]}
+        yield f"data: {json.dumps(final)}\n\n".encode()
+        if (body.get("stream_options") or {}).get("include_usage"):
+            usage = {**base, "choices": [], "usage": self._usage(body, content)}
+            yield f"data: {json.dumps(usage)}\n\n".encode()
+        yield b"data: [DONE]\n\n"
+
+    # ---------------------------------------------------------------------------
+    # Transport handlers
+    # ---------------------------------------------------------------------------
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        """Serve a request from a synchronous client."""
+        body = json.loads(request.content or b"{}")
+        content = self._content_for(body)
+        time.sleep(self.latency)
+
+        if body.get("stream"):
+            def stream() -> Iterable[bytes]:
+                for chunk in self._chunks(body, content):
+                    time.sleep(self.token_latency)
+                    yield chunk
+
+            return httpx.Response(200, headers={"content-type": "text/event-stream"}, content=stream())
+
+        time.sleep(self.token_latency * len(content.split()))
+        return httpx.Response(200, json=self._completion(body, content))
+
+    async def ahandle(self, request: httpx.Request) -> httpx.Response:
+        """Serve a request from an asynchronous client."""
+        body = json.loads(await request.aread() or b"{}")
+        content = self._content_for(body)
+        await asyncio.sleep(self.latency)
+
+        if body.get("stream"):
+            async def stream():
+                for chunk in self._chunks(body, content):
+                    await asyncio.sleep(self.token_latency)
+                    yield chunk
+
+            return httpx.Response(200, headers={"content-type": "text/event-stream"}, content=stream())
+
+        await asyncio.sleep(self.token_latency * len(content.split()))
+        return httpx.Response(200, json=self._completion(body, content))
+
+    # ---------------------------------------------------------------------------
+    # Installation
+    # ---------------------------------------------------------------------------
+
+    def attach(self, model: OpenAIChat) -> None:
+        """Point a model's sync and async clients at this backend."""
+        model.client = OpenAI(
+            api_key="fake",
+            base_url=FAKE_BASE_URL,
+            http_client=httpx.Client(transport=httpx.MockTransport(self.handle)),
+        )
+        model.async_client = AsyncOpenAI(
+            api_key="fake",
+            base_url=FAKE_BASE_URL,
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(self.ahandle)),
+        )
+
+
+def _workflow_agents(workflow: Workflow) -> List[Agent]:
+    """Collect the agents declared as attributes of a workflow class or instance."""
+    agents: Dict[int, Agent] = {}
+    for source in (type(workflow).__dict__, getattr(workflow, "__dict__", {})):
+        for value in source.values():
+            if isinstance(value, Agent):
+                agents[id(value)] = value
+    return list(agents.values())
+
+
+def install_fake_model(
+    agents: Iterable[Agent] = (),
+    teams: Iterable[Team] = (),
+    workflows: Iterable[Workflow] = (),
+    backend: Optional[FakeOpenAIBackend] = None,
+) -> FakeOpenAIBackend:
+    """Route every model used by the given agents, teams and workflows to a fake backend.
+
+    Args:
+        agents: Standalone agents to patch
+        teams: Teams to patch, including their members
+        workflows: Workflows whose agents should be patched
+        backend: Backend to install, a default one is created when omitted
+
+    Returns:
+        The installed backend
+    """
+    backend = backend or FakeOpenAIBackend()
+    seen: set = set()
+
+    def patch_agent(agent: Agent) -> None:
+        if id(agent) in seen:
+            return
+        seen.add(id(agent))
+        if agent.model is None:
+            agent.model = OpenAIChat(id="gpt-4o")
+        backend.attach(agent.model)
+
+    def patch_team(team: Team) -> None:
+        if id(team) in seen:
+            return
+        seen.add(id(team))
+        if team.model is None:
+            team.model = OpenAIChat(id="gpt-4o")
+        backend.attach(team.model)
+        for member in team.members:
+            if isinstance(member, Team):
+                patch_team(member)
+            else:
+                patch_agent(member)
+
+    for agent in agents:
+        patch_agent(agent)
+    for team in teams:
+        patch_team(team)
+    for workflow in workflows:
+        for agent in _workflow_agents(workflow):
+            patch_agent(agent)
+    return backend
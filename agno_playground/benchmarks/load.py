@@ -0,0 +1,404 @@
+"""
+Load-testing harness for the Playground application.
+
+Drives the agent, team and workflow run endpoints with an asyncio load generator
+and reports throughput, latency percentiles, time-to-first-token and error rates as JSON.
+
+Usage:
+    python -m agno_playground.benchmarks.load --rate 5 --duration 60
+    python -m agno_playground.benchmarks.load --base-url http://localhost:7777 --mix agent-stream:1
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import math
+import random
+import re
+import socket
+import sys
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+API_PREFIX = "/v1/playground"
+
+# Scenario name -> (endpoint kind, streaming)
+SCENARIOS: Dict[str, Tuple[str, bool]] = {
+    "agent": ("agents", False),
+    "agent-stream": ("agents", True),
+    "team": ("teams", False),
+    "team-stream": ("teams", True),
+    "workflow": ("workflows", True),
+}
+
+DEFAULT_MIX = "agent:4,agent-stream:4,team:1,team-stream:1,workflow:1"
+
+TTFT_DEFINITION = (
+    "Seconds from the scheduled arrival to the first streamed event carrying model output: "
+    "the first RunResponse event with content for agents and teams, and the first event with "
+    "content after the 'Step i/n: ...' progress updates for workflows. Run, tool call and "
+    "status events do not count. Only measured for streaming scenarios."
+)
+
+# Progress updates the blog workflow streams before any generated content
+_WORKFLOW_STATUS = re.compile(r"^Step \d+/\d+:")
+
+PROMPTS = [
+    "What are the latest trends in renewable energy?",
+    "Summarize the state of the electric vehicle market.",
+    "Plan a content calendar for a developer tools startup.",
+    "How should a small bakery approach social media marketing?",
+    "Explain retrieval-augmented generation to a product manager.",
+]
+
+
+@dataclass
+class RequestResult:
+    """Outcome of a single request issued by the load generator."""
+    scenario: str
+    started: float
+    latency: Optional[float] = None
+    ttft: Optional[float] = None
+    status: Optional[int] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class LoadConfig:
+    """Parameters of a load-test run."""
+    rate: float = 2.0
+    duration: float = 30.0
+    arrival: str = "poisson"
+    mix: Dict[str, float] = field(default_factory=lambda: parse_mix(DEFAULT_MIX))
+    session_pool: int = 20
+    new_session_ratio: float = 0.2
+    max_in_flight: int = 256
+    timeout: float = 600.0
+    agent: Optional[str] = None
+    team: Optional[str] = None
+    workflow: Optional[str] = None
+    seed: Optional[int] = None
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    """Parse a scenario mix such as ``agent:3,team-stream:1`` into weights."""
+    mix: Dict[str, float] = {}
+    for part in spec.split(","):
+        if not part.strip():
+            continue
+        name, _, weight = part.strip().partition(":")
+        if name not in SCENARIOS:
+            raise ValueError(f"Unknown scenario '{name}', expected one of {sorted(SCENARIOS)}")
+        mix[name] = float(weight or 1)
+    if not mix or sum(mix.values()) <= 0:
+        raise ValueError("Scenario mix must contain at least one positive weight")
+    return mix
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile, or None for an empty sample."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = min(len(ordered), max(1, math.ceil(pct / 100 * len(ordered))))
+    return ordered[rank - 1]
+
+
+def is_first_token(kind: str, event: Dict[str, Any]) -> bool:
+    """Whether a streamed run event carries model output, per ``TTFT_DEFINITION``."""
+    content = event.get("content")
+    if content in (None, "", [], {}):
+        return False
+    name = event.get("event")
+    if kind == "workflows":
+        if name == "RunResponse":
+            return not (isinstance(content, str) and _WORKFLOW_STATUS.match(content))
+        return name == "WorkflowCompleted"
+    return name == "RunResponse"
+
+
+class EventStreamParser:
+    """Splits the playground's streaming body, back-to-back JSON objects, into events."""
+
+    def __init__(self):
+        self.buffer = ""
+        self.decoder = json.JSONDecoder()
+
+    def feed(self, text: str) -> List[Dict[str, Any]]:
+        """Add a chunk of the body and return the events completed by it."""
+        self.buffer += text
+        events: List[Dict[str, Any]] = []
+        while True:
+            self.buffer = self.buffer.lstrip()
+            if not self.buffer:
+                return events
+            try:
+                event, end = self.decoder.raw_decode(self.buffer)
+            except json.JSONDecodeError:
+                # The rest of the object is still in flight
+                return events
+            self.buffer = self.buffer[end:]
+            if isinstance(event, dict):
+                events.append(event)
+
+
+def _summarize(results: List[RequestResult], elapsed: float) -> Dict[str, Any]:
+    ok = [r for r in results if r.error is None]
+    latencies = [r.latency for r in ok if r.latency is not None]
+    ttfts = [r.ttft for r in ok if r.ttft is not None]
+    errors: Dict[str, int] = {}
+    for r in results:
+        if r.error is not None:
+            errors[r.error] = errors.get(r.error, 0) + 1
+
+    def stats(values: List[float]) -> Dict[str, Optional[float]]:
+        return {
+            "p50": percentile(values, 50),
+            "p95": percentile(values, 95),
+            "p99": percentile(values, 99),
+            "mean": sum(values) / len(values) if values else None,
+            "max": max(values) if values else None,
+        }
+
+    return {
+        "requests": len(results),
+        "succeeded": len(ok),
+        "errors": len(results) - len(ok),
+        "error_rate": (len(results) - len(ok)) / len(results) if results else 0.0,
+        "error_types": errors,
+        "throughput_rps": len(ok) / elapsed if elapsed > 0 else 0.0,
+        "latency_s": stats(latencies),
+        "ttft_s": stats(ttfts),
+    }
+
+
+class LoadGenerator:
+    """Open-loop load generator against a running Playground application."""
+
+    def __init__(self, base_url: str, config: LoadConfig):
+        self.base_url = base_url.rstrip("/")
+        self.config = config
+        self.random = random.Random(config.seed)
+        self.targets: Dict[str, str] = {}
+        self.sessions: Dict[str, List[str]] = {kind: [] for kind, _ in SCENARIOS.values()}
+        self.results: List[RequestResult] = []
+
+    async def discover(self, client: httpx.AsyncClient) -> None:
+        """Resolve the agent, team and workflow ids to exercise."""
+        wanted = {"agents": self.config.agent, "teams": self.config.team, "workflows": self.config.workflow}
+        needed = {SCENARIOS[name][0] for name in self.config.mix}
+        for kind in needed:
+            response = await client.get(f"{API_PREFIX}/{kind}")
+            response.raise_for_status()
+            entries = response.json()
+            id_key = f"{kind[:-1]}_id"
+            name = wanted[kind]
+            match = next((e for e in entries if name is None or e.get("name") == name or e.get(id_key) == name), None)
+            if match is None:
+                raise RuntimeError(f"No {kind[:-1]} matching '{name}' is registered in the playground")
+            self.targets[kind] = match[id_key]
+
+    def _session_for(self, kind: str) -> str:
+        pool = self.sessions[kind]
+        if pool and self.random.random() >= self.config.new_session_ratio:
+            return self.random.choice(pool)
+        session_id = str(uuid.uuid4())
+        if len(pool) < self.config.session_pool:
+            pool.append(session_id)
+        return session_id
+
+    def _build_request(self, scenario: str) -> Tuple[str, Dict[str, Any]]:
+        kind, stream = SCENARIOS[scenario]
+        message = self.random.choice(PROMPTS)
+        url = f"{API_PREFIX}/{kind}/{self.targets[kind]}/runs"
+        if kind == "workflows":
+            # Workflow runs always start a new session, the playground ignores a session_id
+            body = {
+                "input": {"user_input": message, "use_cached_result": False},
+                "user_id": f"load-user-{uuid.uuid4().hex[:8]}",
+            }
+            return url, {"json": body}
+        session_id = self._session_for(kind)
+        user_id = f"load-user-{session_id[:8]}"
+        form = {"message": message, "stream": str(stream).lower(), "session_id": session_id, "user_id": user_id}
+        return url, {"data": form}
+
+    async def _issue(self, client: httpx.AsyncClient, scenario: str, gate: asyncio.Semaphore) -> None:
+        # Latency is measured from the scheduled arrival, so queueing behind the in-flight
+        # gate is counted rather than hidden.
+        start = time.perf_counter()
+        result = RequestResult(scenario=scenario, started=start)
+        url, kwargs = self._build_request(scenario)
+        try:
+            async with gate:
+                async with client.stream("POST", url, **kwargs) as response:
+                    result.status = response.status_code
+                    kind, stream = SCENARIOS[scenario]
+                    # Only parse until the first token, the rest of the body is just drained
+                    parser = EventStreamParser() if stream and response.status_code < 400 else None
+                    received = 0
+                    async for chunk in response.aiter_text():
+                        received += len(chunk)
+                        if parser is None:
+                            continue
+                        if any(is_first_token(kind, event) for event in parser.feed(chunk)):
+                            result.ttft = time.perf_counter() - start
+                            parser = None
+                    result.latency = time.perf_counter() - start
+                    if response.status_code >= 400:
+                        result.error = f"http_{response.status_code}"
+                    elif received == 0:
+                        # A run that fails after the headers are sent ends the stream early
+                        result.error = "empty_response"
+        except httpx.TimeoutException:
+            result.error = "timeout"
+        except httpx.HTTPError as e:
+            result.error = type(e).__name__
+        self.results.append(result)
+
+    def _next_gap(self) -> float:
+        if self.config.arrival == "constant":
+            return 1.0 / self.config.rate
+        return self.random.expovariate(self.config.rate)
+
+    async def run(self) -> Dict[str, Any]:
+        """Generate load for the configured duration and return the JSON report."""
+        names = list(self.config.mix)
+        weights = [self.config.mix[name] for name in names]
+        gate = asyncio.Semaphore(self.config.max_in_flight)
+        limits = httpx.Limits(max_connections=self.config.max_in_flight, max_keepalive_connections=self.config.max_in_flight)
+
+        async with httpx.AsyncClient(base_url=self.base_url, timeout=self.config.timeout, limits=limits) as client:
+            await self.discover(client)
+            tasks: List[asyncio.Task] = []
+            start = time.perf_counter()
+            next_arrival = start
+            while next_arrival - start < self.config.duration:
+                await asyncio.sleep(max(0.0, next_arrival - time.perf_counter()))
+                scenario = self.random.choices(names, weights)[0]
+                tasks.append(asyncio.create_task(self._issue(client, scenario, gate)))
+                next_arrival += self._next_gap()
+            await asyncio.gather(*tasks)
+            elapsed = time.perf_counter() - start
+
+        return {
+            "config": {
+                "base_url": self.base_url,
+                "rate": self.config.rate,
+                "duration": self.config.duration,
+                "arrival": self.config.arrival,
+                "mix": self.config.mix,
+                "session_pool": self.config.session_pool,
+                "new_session_ratio": self.config.new_session_ratio,
+                "targets": self.targets,
+            },
+            "definitions": {"ttft_s": TTFT_DEFINITION},
+            "elapsed_s": elapsed,
+            "overall": _summarize(self.results, elapsed),
+            "scenarios": {
+                name: _summarize([r for r in self.results if r.scenario == name], elapsed)
+                for name in names
+            },
+        }
+
+
+class _LocalServer:
+    """Serve the Playground app with uvicorn on a background thread."""
+
+    def __init__(self, fake: bool = True):
+        import uvicorn
+
+        from .. import app as app_module
+
+        if fake:
+            from ..config.settings import fake_model_latency, fake_model_token_latency
+            from .fake_model import FakeOpenAIBackend, install_fake_model
+
+            install_fake_model(
+                agents=app_module.standalone_agents,
+                teams=app_module.teams,
+                workflows=app_module.workflows,
+                backend=FakeOpenAIBackend(latency=fake_model_latency, token_latency=fake_model_token_latency),
+            )
+
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            self.port = sock.getsockname()[1]
+        config = uvicorn.Config(app_module.app, host="127.0.0.1", port=self.port, log_level="warning")
+        self.server = uvicorn.Server(config)
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def __enter__(self) -> "_LocalServer":
+        self.thread.start()
+        while not self.server.started:
+            if not self.thread.is_alive():
+                raise RuntimeError("Local playground server failed to start")
+            time.sleep(0.05)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.server.should_exit = True
+        self.thread.join(timeout=10)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Load-test the Agno playground application.")
+    parser.add_argument("--base-url", help="Target a running server instead of serving the app in-process")
+    parser.add_argument("--real-model", action="store_true", help="Use the configured models instead of the fake one")
+    parser.add_argument("--rate", type=float, default=2.0, help="Mean arrival rate in requests per second")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to generate arrivals for")
+    parser.add_argument("--arrival", choices=["poisson", "constant"], default="poisson")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"Weighted scenarios, default '{DEFAULT_MIX}'")
+    parser.add_argument("--session-pool", type=int, default=20, help="Returning sessions kept for agents and teams")
+    parser.add_argument("--new-session-ratio", type=float, default=0.2, help="Share of requests opening a new session")
+    parser.add_argument("--max-in-flight", type=int, default=256)
+    parser.add_argument("--timeout", type=float, default=600.0)
+    parser.add_argument("--agent", help="Agent name or id, defaults to the first registered agent")
+    parser.add_argument("--team", help="Team name or id, defaults to the first registered team")
+    parser.add_argument("--workflow", help="Workflow name or id, defaults to the first registered workflow")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    config = LoadConfig(
+        rate=args.rate,
+        duration=args.duration,
+        arrival=args.arrival,
+        mix=parse_mix(args.mix),
+        session_pool=args.session_pool,
+        new_session_ratio=args.new_session_ratio,
+        max_in_flight=args.max_in_flight,
+        timeout=args.timeout,
+        agent=args.agent,
+        team=args.team,
+        workflow=args.workflow,
+        seed=args.seed,
+    )
+
+    if args.base_url:
+        report = asyncio.run(LoadGenerator(args.base_url, config).run())
+    else:
+        # Logs of the in-process app go to stderr so stdout only carries the report
+        with contextlib.redirect_stdout(sys.stderr), _LocalServer(fake=not args.real_model) as server:
+            report = asyncio.run(LoadGenerator(server.base_url, config).run())
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
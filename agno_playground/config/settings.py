@@ -3,10 +3,77 @@ Application settings for the Agno playground application.
 Contains configuration variables and paths used throughout the application.
 """
 
+import os
 from pathlib import Path
+from typing import Dict, Optional
 
 # Path to agent storage database
 agent_storage: str = "tmp/agents.db"
 
 # Base directory (optional, for future expansion)
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
+
+# Serve every agent, team and workflow from the local fake model instead of OpenAI.
+# Used by the load-testing harness so runs are reproducible and cost nothing.
+fake_model_enabled: bool = os.getenv("AGNO_PLAYGROUND_FAKE_MODEL", "").lower() in ("1", "true", "yes")
+
+# Simulated latency of the fake model, in seconds
+fake_model_latency: float = float(os.getenv("AGNO_PLAYGROUND_FAKE_MODEL_LATENCY", "0.05"))
+fake_model_token_latency: float = float(os.getenv("AGNO_PLAYGROUND_FAKE_MODEL_TOKEN_LATENCY", "0.002"))
+
+# On-demand request profiling. When enabled, a request is profiled if it carries the
+# profiling header or is picked by the sampling rate (0.0 - 1.0).
+profiling_enabled: bool = os.getenv("AGNO_PLAYGROUND_PROFILING", "").lower() in ("1", "true", "yes")
+profiling_sample_rate: float = float(os.getenv("AGNO_PLAYGROUND_PROFILING_SAMPLE_RATE", "0.0"))
+# Seconds between stack samples of a profiled request
+profiling_interval: float = float(os.getenv("AGNO_PLAYGROUND_PROFILING_INTERVAL", "0.005"))
+profiling_header: str = "X-Profile"
+profiling_dir: str = os.getenv("AGNO_PLAYGROUND_PROFILING_DIR", "tmp/profiles")
+profiling_keep: int = int(os.getenv("AGNO_PLAYGROUND_PROFILING_KEEP", "20"))
+
+# Token required by the admin routes, leave unset to allow unauthenticated local access
+admin_token: str = os.getenv("AGNO_PLAYGROUND_ADMIN_TOKEN", "")
+
+# Hedged model requests. A duplicate request is sent when a call outlives the observed
+# latency percentile of its step, and the first valid response wins.
+hedging_enabled: bool = os.getenv("AGNO_PLAYGROUND_HEDGING", "true").lower() in ("1", "true", "yes")
+hedge_percentile: float = float(os.getenv("AGNO_PLAYGROUND_HEDGE_PERCENTILE", "95"))
+hedge_min_samples: int = int(os.getenv("AGNO_PLAYGROUND_HEDGE_MIN_SAMPLES", "20"))
+# Model used for the duplicate request, defaults to the primary model
+hedge_model_id: Optional[str] = os.getenv("AGNO_PLAYGROUND_HEDGE_MODEL") or None
+
+# Per-step latency budgets in seconds, steps not listed use the default budget
+step_deadline_default: float = float(os.getenv("AGNO_PLAYGROUND_STEP_DEADLINE", "300"))
+step_deadlines: Dict[str, float] = {
+    "blog.blog_writer": 600.0,
+    "blog.editor": 600.0,
+    "blog.publisher": 600.0,
+}
+
+# Local index of research references gathered by earlier blog runs
+research_index_path: str = "tmp/research_index.db"
+research_index_ttl_days: float = float(os.getenv("AGNO_PLAYGROUND_RESEARCH_TTL_DAYS", "30"))
+# Indexed references a section needs before its web research is skipped
+research_index_min_hits: int = 2
+
+# Shared HTTP connection pool used by every OpenAI model client in a worker process
+http_max_connections: int = int(os.getenv("AGNO_PLAYGROUND_HTTP_MAX_CONNECTIONS", "200"))
+http_max_keepalive_connections: int = int(os.getenv("AGNO_PLAYGROUND_HTTP_MAX_KEEPALIVE", "50"))
+http_keepalive_expiry: float = float(os.getenv("AGNO_PLAYGROUND_HTTP_KEEPALIVE_EXPIRY", "60"))
+http_use_http2: bool = os.getenv("AGNO_PLAYGROUND_HTTP2", "true").lower() in ("1", "true", "yes")
+
+# How the blog editor step revises drafts: "patch" applies anchored edits locally and
+# falls back to a full rewrite when they do not apply, "rewrite" always re-emits the draft
+blog_edit_mode: str = os.getenv("AGNO_PLAYGROUND_BLOG_EDIT_MODE", "patch")
+
+# Workflow sessions are spread over this many SQLite files by session id
+session_shards: int = int(os.getenv("AGNO_PLAYGROUND_SESSION_SHARDS", "8"))
+session_dir: str = os.getenv("AGNO_PLAYGROUND_SESSION_DIR", "tmp/sessions")
+
+# Finished blog posts, shared by all users and sessions
+blog_post_cache_path: str = "tmp/blog_posts.db"
+
+# Local code index searched by the code assistant, kept current by a file watcher
+code_index_root: str = os.getenv("AGNO_PLAYGROUND_CODE_ROOT", str(BASE_DIR))
+code_index_watch: bool = os.getenv("AGNO_PLAYGROUND_CODE_WATCH", "true").lower() in ("1", "true", "yes")
+code_index_max_file_bytes: int = int(os.getenv("AGNO_PLAYGROUND_CODE_MAX_FILE_BYTES", "1000000"))
@@ -0,0 +1,11 @@
+"""
+Knowledge package.
+
+This package provides local knowledge stores that let agents reuse information
+gathered by earlier runs or look it up without leaving the machine.
+"""
+
+from .code_index import CodeIndex, CodeMatch, IndexStats, Symbol
+from .research_index import IndexedReference, ResearchIndex
+
+__all__ = ["CodeIndex", "CodeMatch", "IndexStats", "IndexedReference", "ResearchIndex", "Symbol"]
@@ -0,0 +1,532 @@
+"""
+Code index module.
+
+Defines an incremental local index of a source tree, combining a trigram index for
+substring search with a symbol table extracted from Python files, kept current by a
+file watcher.
+"""
+
+import ast
+import bisect
+import os
+import re
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from agno.utils.log import logger
+import watchfiles
+
+DEFAULT_EXTENSIONS = frozenset(
+    ".py .pyi .md .rst .txt .toml .cfg .ini .yaml .yml .json .sh .sql .html .css "
+    ".js .jsx .ts .tsx .go .rs .java .c .h .cpp .hpp".split()
+)
+DEFAULT_FILENAMES = frozenset(["Dockerfile", "Makefile"])
+DEFAULT_EXCLUDE_DIRS = frozenset(
+    ".git .hg .svn __pycache__ node_modules .venv venv env .mypy_cache .pytest_cache .ruff_cache "
+    ".tox .idea .vscode build dist tmp".split()
+)
+_WORD = re.compile(r"\w{3,}")
+
+
+@dataclass
+class Symbol:
+    """A class, function or assignment defined in a Python file."""
+    name: str
+    qualname: str
+    kind: str
+    path: str
+    line: int
+    signature: str
+    doc: str = ""
+
+
+@dataclass
+class CodeMatch:
+    """A line of an indexed file containing the searched text."""
+    path: str
+    line: int
+    text: str
+
+
+@dataclass
+class IndexStats:
+    """Outcome of an indexing pass."""
+    files_scanned: int = 0
+    files_indexed: int = 0
+    files_removed: int = 0
+    bytes_indexed: int = 0
+    seconds: float = 0.0
+
+    @property
+    def files_per_second(self) -> float:
+        return self.files_indexed / self.seconds if self.seconds else 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        return {**asdict(self), "files_per_second": self.files_per_second}
+
+
+@dataclass
+class _IndexedFile:
+    text: str
+    lower: str
+    mtime_ns: int
+    size: int
+    trigrams: Set[str] = field(default_factory=set)
+    symbols: List[Symbol] = field(default_factory=list)
+
+
+@lru_cache(maxsize=1 << 18)
+def _word_trigrams(word: str) -> FrozenSet[str]:
+    return frozenset(word[i : i + 3] for i in range(len(word) - 2))
+
+
+def _trigrams(text: str) -> Set[str]:
+    """Trigrams of the words in ``text``.
+
+    Any word of a query found in the text lies within a word of the text, so the query's
+    word trigrams are a subset of these. Identifiers repeat a lot across files, which makes
+    the per-word cache far cheaper than taking every trigram of the raw text.
+    """
+    trigrams: Set[str] = set()
+    for word in set(_WORD.findall(text)):
+        trigrams.update(_word_trigrams(word))
+    return trigrams
+
+
+def _lower(text: str) -> str:
+    lower = text.lower()
+    if len(lower) == len(text):
+        return lower
+    # A few characters lowercase to several, keep them so offsets match the original text
+    return "".join(char if len(char.lower()) != 1 else char.lower() for char in text)
+
+
+def _first_line(doc: Optional[str]) -> str:
+    return doc.strip().splitlines()[0] if doc and doc.strip() else ""
+
+
+def extract_symbols(source: str, path: str) -> List[Symbol]:
+    """Classes, functions, methods and module or class level names defined in Python source.
+
+    Returns an empty list when the source does not parse.
+    """
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return []
+
+    symbols: List[Symbol] = []
+    lines = source.splitlines()
+
+    def source_line(node: ast.stmt) -> str:
+        return lines[node.lineno - 1].strip()[:200] if node.lineno <= len(lines) else ""
+
+    def visit(node: ast.AST, prefix: str, in_class: bool) -> None:
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                symbols.append(Symbol(
+                    name=child.name,
+                    qualname=prefix + child.name,
+                    kind="method" if in_class else "function",
+                    path=path,
+                    line=child.lineno,
+                    signature=source_line(child),
+                    doc=_first_line(ast.get_docstring(child)),
+                ))
+            elif isinstance(child, ast.ClassDef):
+                symbols.append(Symbol(
+                    name=child.name,
+                    qualname=prefix + child.name,
+                    kind="class",
+                    path=path,
+                    line=child.lineno,
+                    signature=source_line(child),
+                    doc=_first_line(ast.get_docstring(child)),
+                ))
+                visit(child, f"{prefix}{child.name}.", True)
+            elif isinstance(child, (ast.Assign, ast.AnnAssign)):
+                targets = child.targets if isinstance(child, ast.Assign) else [child.target]
+                for target in targets:
+                    if isinstance(target, ast.Name):
+                        symbols.append(Symbol(
+                            name=target.id,
+                            qualname=prefix + target.id,
+                            kind="attribute" if in_class else "variable",
+                            path=path,
+                            line=child.lineno,
+                            signature=source_line(child),
+                        ))
+
+    visit(tree, "", False)
+    return symbols
+
+
+class CodeIndex:
+    """Incremental trigram and symbol index over the text files of a source tree.
+
+    Substring searches intersect the trigram postings of the query and only scan the
+    candidate files. Files are re-indexed when their size or modification time changes,
+    and a background watcher applies edits as they happen once the index is started.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        watch: bool = True,
+        max_file_bytes: int = 1_000_000,
+        extensions: Iterable[str] = DEFAULT_EXTENSIONS,
+        exclude_dirs: Iterable[str] = DEFAULT_EXCLUDE_DIRS,
+    ):
+        """
+        Args:
+            root: Directory to index
+            watch: Keep the index current with a file watcher once started
+            max_file_bytes: Larger files are skipped
+            extensions: File extensions to index
+            exclude_dirs: Directory names that are never descended into
+        """
+        self.root = Path(root).resolve()
+        self.watch = watch
+        self.max_file_bytes = max_file_bytes
+        self.extensions = frozenset(extensions)
+        self.exclude_dirs = frozenset(exclude_dirs)
+        self.last_stats: Optional[IndexStats] = None
+        self._lock = threading.RLock()
+        self._files: Dict[str, _IndexedFile] = {}
+        self._postings: Dict[str, Set[str]] = {}
+        self._symbols: Dict[str, List[Symbol]] = {}
+        # Sorted symbol names for prefix lookups, rebuilt lazily after the index changes
+        self._names: Optional[List[str]] = None
+        self._ready = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def __deepcopy__(self, memo):
+        # Shared by every copy of the agent or toolkit using it
+        return self
+
+    # ---------------------------------------------------------------------------
+    # Files
+    # ---------------------------------------------------------------------------
+
+    def _indexable(self, filename: str) -> bool:
+        return os.path.splitext(filename)[1] in self.extensions or filename in DEFAULT_FILENAMES
+
+    def _key(self, path: Path) -> Optional[str]:
+        """Relative POSIX path of a file or directory, or None if it is outside the index."""
+        try:
+            relative = (path if path.is_absolute() else self.root / path).resolve().relative_to(self.root)
+        except ValueError:
+            return None
+        return relative.as_posix()
+
+    def _relative(self, path: Path) -> Optional[str]:
+        """Index key of a path, or None if the path is outside the indexed files."""
+        relative = self._key(path)
+        if relative is None:
+            return None
+        parts = relative.split("/")
+        if any(part in self.exclude_dirs for part in parts[:-1]) or not self._indexable(parts[-1]):
+            return None
+        return relative
+
+    def _walk(self, prefix: str = "") -> Iterable[Tuple[str, os.stat_result]]:
+        for directory, dirnames, filenames in os.walk(self.root / prefix):
+            dirnames[:] = [name for name in dirnames if name not in self.exclude_dirs]
+            relative = Path(directory).relative_to(self.root).as_posix()
+            for filename in filenames:
+                if not self._indexable(filename):
+                    continue
+                try:
+                    stat = os.stat(os.path.join(directory, filename))
+                except OSError:
+                    continue
+                yield (filename if relative == "." else f"{relative}/{filename}"), stat
+
+    # ---------------------------------------------------------------------------
+    # Mutation
+    # ---------------------------------------------------------------------------
+
+    def _remove(self, relative: str) -> bool:
+        indexed = self._files.pop(relative, None)
+        if indexed is None:
+            return False
+        for trigram in indexed.trigrams:
+            paths = self._postings.get(trigram)
+            if paths is not None:
+                paths.discard(relative)
+                if not paths:
+                    del self._postings[trigram]
+        for symbol in indexed.symbols:
+            entries = self._symbols.get(symbol.name.lower(), [])
+            entries[:] = [entry for entry in entries if entry.path != relative]
+            if not entries:
+                self._symbols.pop(symbol.name.lower(), None)
+        self._names = None
+        return True
+
+    def _index_file(self, relative: str, stat: os.stat_result) -> int:
+        """Index one file, returning the bytes read, or 0 if the file was skipped."""
+        if stat.st_size > self.max_file_bytes:
+            self._remove(relative)
+            return 0
+        try:
+            text = (self.root / relative).read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            self._remove(relative)
+            return 0
+        lower = _lower(text)
+        indexed = _IndexedFile(
+            text=text,
+            lower=lower,
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            trigrams=_trigrams(lower),
+            symbols=extract_symbols(text, relative) if relative.endswith((".py", ".pyi")) else [],
+        )
+        self._remove(relative)
+        self._files[relative] = indexed
+        for trigram in indexed.trigrams:
+            self._postings.setdefault(trigram, set()).add(relative)
+        for symbol in indexed.symbols:
+            self._symbols.setdefault(symbol.name.lower(), []).append(symbol)
+        self._names = None
+        return stat.st_size
+
+    def _rescan(self, prefix: str, stats: IndexStats) -> None:
+        """Re-index new and changed files under ``prefix``, dropping the ones that are gone."""
+        seen: Set[str] = set()
+        for relative, stat in self._walk(prefix):
+            seen.add(relative)
+            stats.files_scanned += 1
+            indexed = self._files.get(relative)
+            if indexed is not None and indexed.mtime_ns == stat.st_mtime_ns and indexed.size == stat.st_size:
+                continue
+            with self._lock:
+                read = self._index_file(relative, stat)
+            if read:
+                stats.files_indexed += 1
+                stats.bytes_indexed += read
+        under = f"{prefix}/" if prefix else ""
+        with self._lock:
+            for relative in [key for key in self._files if key.startswith(under) and key not in seen]:
+                self._remove(relative)
+                stats.files_removed += 1
+
+    def refresh(self) -> IndexStats:
+        """Scan the tree and re-index new and changed files, dropping deleted ones."""
+        stats = IndexStats()
+        started = time.perf_counter()
+        self._rescan("", stats)
+        stats.seconds = time.perf_counter() - started
+        self.last_stats = stats
+        self._ready.set()
+        logger.info(
+            f"Code index of {self.root}: {stats.files_indexed} files indexed "
+            f"({stats.bytes_indexed / 1e6:.1f} MB) in {stats.seconds:.2f}s, "
+            f"{stats.files_per_second:.0f} files/s, {len(self._files)} files total"
+        )
+        return stats
+
+    def update(self, paths: Iterable[str]) -> int:
+        """Re-index or drop the given files, returning how many were changed.
+
+        Events on a directory do not name the files inside it, so a directory that was
+        created, moved or deleted is re-scanned as a whole.
+        """
+        changed = 0
+        for raw_path in paths:
+            path = Path(raw_path)
+            if path.is_dir() or (not path.exists() and not self._indexable(path.name)):
+                prefix = self._key(path)
+                if prefix is not None and not any(part in self.exclude_dirs for part in prefix.split("/")):
+                    stats = IndexStats()
+                    self._rescan(prefix if prefix != "." else "", stats)
+                    changed += stats.files_indexed + stats.files_removed
+                continue
+            relative = self._relative(path)
+            if relative is None:
+                continue
+            with self._lock:
+                try:
+                    changed += bool(self._index_file(relative, path.stat()))
+                except OSError:
+                    changed += self._remove(relative)
+        return changed
+
+    # ---------------------------------------------------------------------------
+    # Lifecycle
+    # ---------------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Build the index in the background, then keep it current if watching is enabled."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="code-index", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop watching for changes, waiting for the watcher to exit."""
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    def ensure_ready(self, timeout: Optional[float] = None) -> bool:
+        """Start the index if needed and wait for the initial build."""
+        self.start()
+        return self._ready.wait(timeout)
+
+    def _run(self) -> None:
+        try:
+            self.refresh()
+        except Exception as e:
+            logger.error(f"Could not build the code index of {self.root}: {e}")
+            self._ready.set()
+            return
+        if not self.watch:
+            return
+        try:
+            # The watcher only sees changes made once it runs. Its first yield, at the latest
+            # after rust_timeout, means it does, so refresh then to catch edits made meanwhile.
+            caught_up = False
+            for changes in watchfiles.watch(
+                self.root, stop_event=self._stop, raise_interrupt=False, yield_on_timeout=True, rust_timeout=1000
+            ):
+                if not caught_up:
+                    caught_up = True
+                    self.refresh()
+                changed = self.update(path for _, path in changes)
+                if changed:
+                    logger.debug(f"Code index updated {changed} files")
+        except Exception as e:
+            logger.warning(f"Code index watcher stopped, the index may go stale: {e}")
+
+    # ---------------------------------------------------------------------------
+    # Search
+    # ---------------------------------------------------------------------------
+
+    def search(self, query: str, limit: int = 20, path_prefix: str = "") -> List[CodeMatch]:
+        """Find lines containing ``query``, case-insensitively.
+
+        Args:
+            query: Literal text to find
+            limit: Maximum number of matching lines
+            path_prefix: Only search files under this relative path
+
+        Returns:
+            Matches ordered by path and line
+        """
+        needle = _lower(query)
+        if not needle.strip():
+            return []
+        matches: List[CodeMatch] = []
+        with self._lock:
+            trigrams = _trigrams(needle)
+            if trigrams:
+                postings = sorted((self._postings.get(trigram, set()) for trigram in trigrams), key=len)
+                candidates = set(postings[0]).intersection(*postings[1:])
+            else:
+                # Too short to narrow down, scan every file
+                candidates = set(self._files)
+            for relative in sorted(candidates):
+                if not relative.startswith(path_prefix):
+                    continue
+                indexed = self._files[relative]
+                position = indexed.lower.find(needle)
+                line, counted_to, last_line = 1, 0, 0
+                while position != -1:
+                    line += indexed.lower.count("\n", counted_to, position)
+                    counted_to = position
+                    if line != last_line:
+                        start = indexed.text.rfind("\n", 0, position) + 1
+                        end = indexed.text.find("\n", position)
+                        text = indexed.text[start : end if end != -1 else None].strip()
+                        matches.append(CodeMatch(path=relative, line=line, text=text[:200]))
+                        last_line = line
+                        if len(matches) >= limit:
+                            return matches
+                    position = indexed.lower.find(needle, position + 1)
+        return matches
+
+    def find_symbols(self, name: str, kind: Optional[str] = None, limit: int = 20) -> List[Symbol]:
+        """Find symbols by name, case-insensitively.
+
+        Exact name matches come first, then names starting with ``name``, then names
+        containing it. A dotted name is matched against qualified names.
+        """
+        needle = name.lower().strip()
+        if not needle:
+            return []
+        qualified = "." in needle
+        last_part = needle.rsplit(".", 1)[-1]
+
+        def rank(value: str) -> Optional[int]:
+            if value == needle:
+                return 0
+            if value.startswith(needle):
+                return 1
+            return 2 if needle in value else None
+
+        ranked: List[Tuple[int, str, int, Symbol]] = []
+
+        def collect(keys: Iterable[str]) -> None:
+            for key in keys:
+                for symbol in self._symbols[key]:
+                    if kind and symbol.kind != kind:
+                        continue
+                    symbol_rank = rank(symbol.qualname.lower() if qualified else key)
+                    if symbol_rank is not None:
+                        ranked.append((symbol_rank, symbol.path, symbol.line, symbol))
+
+        with self._lock:
+            if qualified:
+                collect([key for key in self._symbols if last_part in key])
+            else:
+                # Exact and prefix matches by bisection, substrings only when those are too few
+                if self._names is None:
+                    self._names = sorted(self._symbols)
+                start = end = bisect.bisect_left(self._names, needle)
+                while end < len(self._names) and self._names[end].startswith(needle):
+                    end += 1
+                collect(self._names[start:end])
+                if len(ranked) < limit:
+                    collect([key for key in self._names if needle in key and not key.startswith(needle)])
+        ranked.sort(key=lambda entry: entry[:3])
+        return [entry[3] for entry in ranked[:limit]]
+
+    def outline(self, path: str) -> List[Symbol]:
+        """Symbols defined in one indexed file, in source order."""
+        with self._lock:
+            indexed = self._files.get(self._relative(Path(path)) or "")
+            return list(indexed.symbols) if indexed else []
+
+    def read(self, path: str, start_line: int = 1, end_line: Optional[int] = None) -> Optional[str]:
+        """Numbered lines of an indexed file, or None if the file is not indexed."""
+        with self._lock:
+            indexed = self._files.get(self._relative(Path(path)) or "")
+            if indexed is None:
+                return None
+            lines = indexed.text.splitlines()
+        start = max(1, start_line)
+        end = min(len(lines), end_line or len(lines))
+        return "\n".join(f"{number:>5}  {lines[number - 1]}" for number in range(start, end + 1))
+
+    def status(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "root": str(self.root),
+                "ready": self._ready.is_set(),
+                "watching": self.watch and self._thread is not None and not self._stop.is_set(),
+                "files": len(self._files),
+                "symbols": sum(len(entries) for entries in self._symbols.values()),
+                "trigrams": len(self._postings),
+                "last_refresh": self.last_stats.to_dict() if self.last_stats else None,
+            }
@@ -0,0 +1,310 @@
+"""
+Research index module.
+
+Defines a persistent local index of references gathered by earlier blog runs, combining
+a BM25 inverted index with a hashed-feature vector index and freshness metadata.
+"""
+
+import hashlib
+import json
+import math
+import re
+import sqlite3
+import threading
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from agno.utils.log import logger
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have how in is it its of on or that the this to was were what "
+    "when which who why will with your you".split()
+)
+
+
+def _stem(token: str) -> str:
+    """Strip common English plural and gerund suffixes."""
+    if len(token) > 4 and token.endswith("ies"):
+        return token[:-3] + "y"
+    for suffix in ("ing", "es", "s"):
+        if len(token) - len(suffix) >= 3 and token.endswith(suffix) and not token.endswith("ss"):
+            return token[: -len(suffix)]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase, lightly stemmed word tokens without stopwords."""
+    return [_stem(token) for token in _TOKEN.findall(text.lower()) if token not in _STOPWORDS]
+
+
+@dataclass
+class IndexedReference:
+    """A reference stored in the research index."""
+    doc_id: str
+    title: str
+    url: Optional[str]
+    key_points: List[str]
+    topics: List[str] = field(default_factory=list)
+    added_at: float = field(default_factory=time.time)
+
+    @property
+    def text(self) -> str:
+        return " ".join([self.title, *self.key_points, *self.topics])
+
+
+class ResearchIndex:
+    """Hybrid BM25 and vector index over previously gathered research references.
+
+    Vectors are built with the hashing trick over word unigrams and bigrams, so the index
+    needs no embedding model. References are persisted in SQLite, which every worker
+    process writes to directly, and the in-memory index is rebuilt whenever another process
+    changed them. References older than the TTL are deleted on load and on every write.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl_days: float = 30.0,
+        dim: int = 1024,
+        k1: float = 1.5,
+        b: float = 0.75,
+    ):
+        """
+        Args:
+            path: SQLite file the references are persisted to
+            ttl_days: Age after which references are dropped
+            dim: Dimension of the hashed feature vectors
+            k1: BM25 term frequency saturation
+            b: BM25 length normalization
+        """
+        self.path = Path(path)
+        self.ttl = ttl_days * 86400
+        self.dim = dim
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.RLock()
+        self._local = threading.local()
+        self._reset()
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS refs (doc_id TEXT PRIMARY KEY, title TEXT NOT NULL, url TEXT, "
+                "key_points TEXT NOT NULL, topics TEXT NOT NULL, added_at REAL NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS refs_added_at ON refs (added_at)")
+        with self._lock:
+            self._load()
+
+    def _reset(self) -> None:
+        self._docs: List[IndexedReference] = []
+        self._positions: Dict[str, int] = {}
+        self._postings: Dict[str, Dict[int, int]] = defaultdict(dict)
+        self._lengths: List[int] = []
+        self._vectors: List[np.ndarray] = []
+        # Stacked vectors, rebuilt lazily after the index changes
+        self._matrix: Optional[np.ndarray] = None
+        # Row count and latest write time of the table when the index was last synced
+        self._version: Optional[Tuple[int, float]] = None
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    # ---------------------------------------------------------------------------
+    # Features
+    # ---------------------------------------------------------------------------
+
+    def _embed(self, tokens: List[str]) -> np.ndarray:
+        vector = np.zeros(self.dim, dtype=np.float32)
+        features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+        for feature in features:
+            digest = hashlib.blake2b(feature.encode(), digest_size=8).digest()
+            bucket = int.from_bytes(digest[:4], "little") % self.dim
+            vector[bucket] += 1.0 if digest[4] & 1 else -1.0
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _bm25(self, tokens: List[str]) -> np.ndarray:
+        scores = np.zeros(len(self._docs), dtype=np.float32)
+        if not self._docs:
+            return scores
+        avg_length = sum(self._lengths) / len(self._lengths)
+        for token in set(tokens):
+            postings = self._postings.get(token)
+            if not postings:
+                continue
+            idf = math.log(1 + (len(self._docs) - len(postings) + 0.5) / (len(postings) + 0.5))
+            for position, tf in postings.items():
+                norm = self.k1 * (1 - self.b + self.b * self._lengths[position] / avg_length)
+                scores[position] += idf * tf * (self.k1 + 1) / (tf + norm)
+        return scores
+
+    # ---------------------------------------------------------------------------
+    # Mutation
+    # ---------------------------------------------------------------------------
+
+    @staticmethod
+    def doc_id_for(title: str, url: Optional[str]) -> str:
+        key = (url or title).strip().lower()
+        return hashlib.sha1(key.encode()).hexdigest()[:16]
+
+    def _index(self, doc: IndexedReference) -> None:
+        tokens = tokenize(doc.text)
+        position = self._positions.get(doc.doc_id)
+        if position is None:
+            position = len(self._docs)
+            self._positions[doc.doc_id] = position
+            self._docs.append(doc)
+            self._lengths.append(len(tokens))
+            self._vectors.append(self._embed(tokens))
+        else:
+            for token in set(tokenize(self._docs[position].text)):
+                self._postings[token].pop(position, None)
+            self._docs[position] = doc
+            self._lengths[position] = len(tokens)
+            self._vectors[position] = self._embed(tokens)
+        self._matrix = None
+        for token, tf in Counter(tokens).items():
+            self._postings[token][position] = tf
+
+    def add(self, references: Iterable[Dict], topic: Optional[str] = None) -> int:
+        """Add or refresh references, merging key points of known ones.
+
+        Known references are merged with their stored version, so concurrent writers from
+        other processes do not overwrite each other.
+
+        Args:
+            references: Dicts with ``title``, ``url`` and ``key_points``
+            topic: Subject the references were gathered for
+
+        Returns:
+            Number of references added or refreshed
+        """
+        docs = []
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                # Take the write lock up front so the merge reads what it overwrites
+                connection.execute("BEGIN IMMEDIATE")
+                in_sync = self._table_version(connection) == self._version
+                expired = self._delete_expired(connection)
+                for reference in references:
+                    doc = IndexedReference(
+                        doc_id=self.doc_id_for(reference["title"], reference.get("url")),
+                        title=reference["title"],
+                        url=reference.get("url"),
+                        key_points=list(reference.get("key_points", [])),
+                        topics=[topic] if topic else [],
+                    )
+                    previous = self._read(connection, doc.doc_id)
+                    if previous is not None:
+                        doc.key_points = list(dict.fromkeys(previous.key_points + doc.key_points))
+                        doc.topics = list(dict.fromkeys(previous.topics + doc.topics))
+                    connection.execute(
+                        "INSERT OR REPLACE INTO refs (doc_id, title, url, key_points, topics, added_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (doc.doc_id, doc.title, doc.url, json.dumps(doc.key_points), json.dumps(doc.topics), doc.added_at),
+                    )
+                    docs.append(doc)
+                version = self._table_version(connection)
+
+            if in_sync and not expired:
+                for doc in docs:
+                    self._index(doc)
+                self._version = version
+            else:
+                self._load()
+        return len(docs)
+
+    # ---------------------------------------------------------------------------
+    # Search
+    # ---------------------------------------------------------------------------
+
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        min_similarity: float = 0.1,
+        bm25_weight: float = 0.5,
+    ) -> List[Tuple[IndexedReference, float]]:
+        """Find fresh references relevant to a query.
+
+        Candidates must share at least one term with the query and reach ``min_similarity``
+        cosine similarity. They are ranked by a blend of normalized BM25 and cosine scores.
+
+        Returns:
+            ``(reference, score)`` pairs, best first
+        """
+        tokens = tokenize(query)
+        with self._lock:
+            self._sync()
+            if not tokens or not self._docs:
+                return []
+            if self._matrix is None:
+                self._matrix = np.vstack(self._vectors)
+            bm25 = self._bm25(tokens)
+            cosine = self._matrix @ self._embed(tokens)
+            fresh = np.array([time.time() - doc.added_at <= self.ttl for doc in self._docs])
+            candidates = (bm25 > 0) & (cosine >= min_similarity) & fresh
+            if not candidates.any():
+                return []
+            scores = bm25_weight * bm25 / bm25[candidates].max() + (1 - bm25_weight) * cosine
+            ranked = [i for i in np.argsort(-scores) if candidates[i]][:limit]
+            return [(self._docs[i], float(scores[i])) for i in ranked]
+
+    # ---------------------------------------------------------------------------
+    # Persistence
+    # ---------------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    @staticmethod
+    def _table_version(connection: sqlite3.Connection) -> Tuple[int, float]:
+        count, latest = connection.execute("SELECT COUNT(*), MAX(added_at) FROM refs").fetchone()
+        return count, latest or 0.0
+
+    @staticmethod
+    def _row_to_doc(row: Tuple) -> IndexedReference:
+        doc_id, title, url, key_points, topics, added_at = row
+        return IndexedReference(doc_id, title, url, json.loads(key_points), json.loads(topics), added_at)
+
+    def _read(self, connection: sqlite3.Connection, doc_id: str) -> Optional[IndexedReference]:
+        row = connection.execute(
+            "SELECT doc_id, title, url, key_points, topics, added_at FROM refs WHERE doc_id = ?", (doc_id,)
+        ).fetchone()
+        return self._row_to_doc(row) if row else None
+
+    def _delete_expired(self, connection: sqlite3.Connection) -> int:
+        return connection.execute("DELETE FROM refs WHERE added_at < ?", (time.time() - self.ttl,)).rowcount
+
+    def _load(self) -> None:
+        """Rebuild the in-memory index from the fresh stored references."""
+        connection = self._connect()
+        with connection:
+            expired = self._delete_expired(connection)
+            rows = connection.execute("SELECT doc_id, title, url, key_points, topics, added_at FROM refs").fetchall()
+            version = self._table_version(connection)
+        self._reset()
+        for row in rows:
+            self._index(self._row_to_doc(row))
+        self._version = version
+        logger.debug(f"Loaded {len(self._docs)} references into the research index, dropped {expired} expired")
+
+    def _sync(self) -> None:
+        """Reload the index if another process changed the stored references."""
+        try:
+            if self._table_version(self._connect()) != self._version:
+                self._load()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not refresh research index from {self.path}: {e}")
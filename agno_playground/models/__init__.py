@@ -0,0 +1,19 @@
+"""
+Models package.
+
+This package provides the model configurations shared by agents, teams, and workflows.
+"""
+
+from .hedging import HedgedOpenAIChat, StepDeadlineExceeded, hedge_registry, hedged_chat, step_deadline
+from .provider import PooledOpenAIChat, chat_model, client_provider
+
+__all__ = [
+    "HedgedOpenAIChat",
+    "PooledOpenAIChat",
+    "StepDeadlineExceeded",
+    "chat_model",
+    "client_provider",
+    "hedge_registry",
+    "hedged_chat",
+    "step_deadline",
+]
@@ -0,0 +1,665 @@
+"""
+Hedged model module.
+
+Defines an OpenAIChat model that enforces per-step deadlines and sends a duplicate
+request when a call outlives the observed tail latency of its step.
+"""
+
+import asyncio
+import copy
+import functools
+import itertools
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Iterator, List, Optional, Tuple, Type
+
+import httpx
+from agno.exceptions import ModelProviderError
+from agno.models.message import Message
+from agno.models.openai import OpenAIChat
+from agno.utils.log import logger
+from openai import (
+    DEFAULT_MAX_RETRIES,
+    APIConnectionError,
+    APIStatusError,
+    APITimeoutError,
+    AsyncStream,
+    LengthFinishReasonError,
+    Stream,
+)
+from openai.lib._parsing._completions import type_to_response_format_param
+from openai.lib.streaming.chat import ChatCompletionStreamState
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
+from pydantic import BaseModel
+
+from ..config.settings import (
+    hedge_min_samples,
+    hedge_model_id,
+    hedge_percentile,
+    hedging_enabled,
+    step_deadline_default,
+    step_deadlines,
+)
+from .provider import PooledOpenAIChat
+
+
+class StepDeadlineExceeded(TimeoutError):
+    """Raised when a model call does not complete within its step's latency budget."""
+
+
+class StepLatency:
+    """Rolling latency window and hedging counters for one step."""
+
+    def __init__(self, window: int = 200):
+        self.samples: Deque[float] = deque(maxlen=window)
+        self.calls = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.cancelled = 0
+        self.retries = 0
+        self.timeouts = 0
+        self.errors = 0
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Nearest-rank percentile of the recorded latencies, or None without samples."""
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered), max(1, math.ceil(pct / 100 * len(ordered)))) - 1]
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "hedged": self.hedged,
+            "hedge_rate": self.hedged / self.calls if self.calls else 0.0,
+            "hedge_wins": self.hedge_wins,
+            "hedge_win_rate": self.hedge_wins / self.hedged if self.hedged else 0.0,
+            "cancelled": self.cancelled,
+            "retries": self.retries,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+            "latency_p50_s": self.percentile(50),
+            "latency_p95_s": self.percentile(95),
+            "latency_p99_s": self.percentile(99),
+        }
+
+
+class HedgeRegistry:
+    """Process-wide latency and hedging statistics, keyed by step name."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._steps: Dict[str, StepLatency] = {}
+
+    def percentile(self, name: str, pct: float, min_samples: int = 1) -> Optional[float]:
+        """Latency percentile of a step, or None until it has ``min_samples`` samples."""
+        with self._lock:
+            stats = self._steps.get(name)
+            if stats is None or len(stats.samples) < min_samples:
+                return None
+            return stats.percentile(pct)
+
+    def update(self, name: str, **counters: int) -> None:
+        """Increment counters of a step under the registry lock."""
+        with self._lock:
+            stats = self._steps.setdefault(name, StepLatency())
+            for counter, value in counters.items():
+                setattr(stats, counter, getattr(stats, counter) + value)
+
+    def record(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self._steps.setdefault(name, StepLatency()).samples.append(seconds)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {name: stats.snapshot() for name, stats in sorted(self._steps.items())}
+
+
+hedge_registry = HedgeRegistry()
+
+
+def _time_until(*moments: Optional[float]) -> Optional[float]:
+    """Seconds until the earliest of the given ``perf_counter`` moments, None if all are unset."""
+    upcoming = [moment for moment in moments if moment is not None]
+    return max(0.0, min(upcoming) - time.perf_counter()) if upcoming else None
+
+
+def _is_transient(error: BaseException) -> bool:
+    """Whether a failed request is worth retrying: dropped connections, 408, 409, 429 and 5xx.
+
+    Timeouts are not retried, the attempt already used the time the budget gave it.
+    """
+    if isinstance(error, (APITimeoutError, httpx.TimeoutException)):
+        return False
+    if isinstance(error, APIStatusError):
+        return error.status_code in (408, 409, 429) or error.status_code >= 500
+    return isinstance(error, (APIConnectionError, httpx.TransportError))
+
+
+class _Cancelled(Exception):
+    """Raised inside a request that was closed because it lost a race or ran out of budget."""
+
+
+@dataclass(frozen=True)
+class _Budget:
+    """Latency budget of a call: the ``perf_counter`` moment it runs out and its length."""
+
+    at: float
+    seconds: float
+
+    def remaining(self) -> float:
+        return max(0.0, self.at - time.perf_counter())
+
+
+def _expired(budget: Optional[_Budget]) -> bool:
+    return budget is not None and time.perf_counter() >= budget.at
+
+
+# Shared pool running the primary and hedge requests of synchronous calls
+_executor = ThreadPoolExecutor(max_workers=64, thread_name_prefix="hedged-model")
+
+# Budget of the enclosing step, see ``step_deadline``
+_step_budget: ContextVar[Optional[_Budget]] = ContextVar("step_budget", default=None)
+
+# Strict JSON schema sent for a pydantic response format, built once per model class
+_response_format_param = functools.lru_cache(maxsize=None)(type_to_response_format_param)
+
+# Backoff before the first retry of a transient failure, doubled on every further retry
+_RETRY_BACKOFF = 0.5
+_RETRY_BACKOFF_MAX = 8.0
+
+
+@contextmanager
+def step_deadline(seconds: Optional[float]) -> Iterator[None]:
+    """Share one latency budget between all hedged model calls made inside the block.
+
+    Time spent in tool calls and agent bookkeeping between model calls uses up the budget
+    too, and the first model call after it ran out raises ``StepDeadlineExceeded``.
+    Nested blocks keep the earlier deadline.
+
+    Args:
+        seconds: Budget of the block, None to leave the calls unbounded
+    """
+    if seconds is None:
+        yield
+        return
+    budget = _Budget(time.perf_counter() + seconds, seconds)
+    outer = _step_budget.get()
+    token = _step_budget.set(budget if outer is None or budget.at < outer.at else outer)
+    try:
+        yield
+    finally:
+        _step_budget.reset(token)
+
+
+@dataclass
+class HedgedOpenAIChat(PooledOpenAIChat):
+    """Pooled OpenAIChat with per-step deadlines, retries and hedged requests.
+
+    Calls made inside a ``step_deadline`` block share its budget, other calls get
+    ``deadline`` seconds each. Every request is streamed and checked between chunks, so a
+    request that runs out of budget or loses a race is closed right away instead of holding
+    a connection and generating tokens. Non-streaming calls accumulate the chunks into one
+    completion. Connection failures, 408, 409, 429 and 5xx responses are retried with
+    backoff up to ``max_retries`` times while the budget lasts, timeouts are not.
+
+    Structured outputs are requested with the strict JSON schema of the response model, but
+    parsed leniently: a completion the model rejects is passed on as text for local repair
+    instead of failing the call.
+
+    Once a step has ``min_samples`` recorded latencies, a call still running after the
+    step's ``hedge_percentile`` latency is duplicated, optionally on ``hedge_model_id``.
+    The first successful response wins and the other request is closed. Streaming calls
+    race for their first chunk and are tracked separately, under ``<step>.stream``.
+    Until a step has enough samples, sync calls run directly on the calling thread.
+    """
+
+    step: Optional[str] = None
+    hedge_model_id: Optional[str] = None
+    hedge_percentile: float = 95.0
+    min_samples: int = 20
+    deadline: Optional[float] = None
+    hedging: bool = True
+
+    @property
+    def step_name(self) -> str:
+        return self.step or self.id
+
+    def _hedge_delay(self, name: str) -> Optional[float]:
+        if not self.hedging:
+            return None
+        return hedge_registry.percentile(name, self.hedge_percentile, self.min_samples)
+
+    def _hedge_copy(self) -> "HedgedOpenAIChat":
+        # A shallow copy shares the HTTP client and the request configuration
+        hedge = copy.copy(self)
+        hedge.id = self.hedge_model_id or self.id
+        return hedge
+
+    def _budget(self, started: float) -> Optional[_Budget]:
+        """Budget of the current call: the enclosing step's, if any."""
+        step_budget = _step_budget.get()
+        if step_budget is not None:
+            return step_budget
+        return _Budget(started + self.deadline, self.deadline) if self.deadline is not None else None
+
+    def _retries(self) -> int:
+        return self.max_retries if self.max_retries is not None else DEFAULT_MAX_RETRIES
+
+    def _request_kwargs(self, budget: Optional[_Budget]) -> Dict[str, Any]:
+        """Request arguments, timing out when the budget runs out.
+
+        A pydantic response format is sent as its strict JSON schema.
+        """
+        kwargs = dict(self.request_kwargs)
+        if isinstance(kwargs.get("response_format"), type):
+            kwargs["response_format"] = _response_format_param(kwargs["response_format"])
+        if budget is not None:
+            kwargs["timeout"] = max(0.001, budget.remaining())
+        return kwargs
+
+    def _parse_format(self) -> Optional[Type[BaseModel]]:
+        """Model class the final completion is parsed into, if structured outputs are used."""
+        if self.structured_outputs and isinstance(self.response_format, type):
+            return self.response_format
+        return None
+
+    def _provider_error(self, error: Exception) -> ModelProviderError:
+        """Wrap a failed request the way OpenAIChat does, the original error stays the cause."""
+        logger.error(f"Error from OpenAI API for step '{self.step_name}': {error}")
+        if isinstance(error, APIStatusError):
+            try:
+                message = error.response.json().get("error", {})
+            except Exception:
+                message = error.response.text
+            if isinstance(message, dict):
+                message = message.get("message", "Unknown model error")
+            return ModelProviderError(
+                message=message, status_code=error.status_code, model_name=self.name, model_id=self.id
+            )
+        return ModelProviderError(message=str(error), model_name=self.name, model_id=self.id)
+
+    def _backoff(self, error: Exception, attempt: int, retries: int, budget: Optional[_Budget]) -> Optional[float]:
+        """Seconds to wait before retrying a failed request, None when it must not be retried."""
+        if attempt >= retries or not _is_transient(error):
+            return None
+        backoff = min(_RETRY_BACKOFF_MAX, _RETRY_BACKOFF * 2**attempt)
+        if budget is not None and budget.remaining() <= backoff:
+            return None
+        hedge_registry.update(self.step_name, retries=1)
+        logger.warning(f"Retrying step '{self.step_name}' in {backoff:.1f}s after: {error}")
+        return backoff
+
+    def _open(
+        self,
+        messages: List[Message],
+        budget: Optional[_Budget],
+        retries: int,
+        cancelled: Optional[threading.Event] = None,
+    ) -> Tuple[Stream[ChatCompletionChunk], Optional[ChatCompletionChunk]]:
+        """Open a streaming request and wait for its first chunk, retrying transient failures.
+
+        The client's own retries are turned off, they would retry timeouts and ignore the budget.
+        """
+        cancelled = cancelled or threading.Event()
+        for attempt in itertools.count():
+            stream = None
+            try:
+                stream = self.get_client().with_options(max_retries=0).chat.completions.create(
+                    model=self.id,
+                    messages=[self._format_message(m) for m in messages],  # type: ignore
+                    stream=True,
+                    stream_options={"include_usage": True},
+                    **self._request_kwargs(budget),
+                )
+                return stream, next(iter(stream), None)
+            except Exception as e:
+                if stream is not None:
+                    stream.close()
+                backoff = self._backoff(e, attempt, retries, budget)
+                if backoff is None:
+                    raise self._provider_error(e) from e
+                if cancelled.wait(backoff):
+                    raise _Cancelled() from e
+        raise AssertionError("unreachable")
+
+    async def _aopen(
+        self, messages: List[Message], budget: Optional[_Budget], retries: int
+    ) -> Tuple[AsyncStream[ChatCompletionChunk], Optional[ChatCompletionChunk]]:
+        """Async ``_open``, closing the request when the calling task is cancelled."""
+        for attempt in itertools.count():
+            stream = None
+            try:
+                stream = await self.get_async_client().with_options(max_retries=0).chat.completions.create(
+                    model=self.id,
+                    messages=[self._format_message(m) for m in messages],  # type: ignore
+                    stream=True,
+                    stream_options={"include_usage": True},
+                    **self._request_kwargs(budget),
+                )
+                return stream, await anext(aiter(stream), None)
+            except asyncio.CancelledError:
+                if stream is not None:
+                    await stream.close()
+                raise
+            except Exception as e:
+                if stream is not None:
+                    await stream.close()
+                backoff = self._backoff(e, attempt, retries, budget)
+                if backoff is None:
+                    raise self._provider_error(e) from e
+                await asyncio.sleep(backoff)
+        raise AssertionError("unreachable")
+
+    def _chunks(
+        self,
+        stream: Stream[ChatCompletionChunk],
+        first: Optional[ChatCompletionChunk],
+        budget: Optional[_Budget],
+        cancelled: Optional[threading.Event] = None,
+    ) -> Iterator[ChatCompletionChunk]:
+        """Read an opened stream, closing it once the budget runs out or ``cancelled`` is set.
+
+        Raises:
+            _Cancelled: When the stream was closed early
+            ModelProviderError: When the stream failed
+        """
+        with stream:
+            try:
+                for chunk in itertools.chain([first] if first is not None else [], stream):
+                    if _expired(budget) or (cancelled is not None and cancelled.is_set()):
+                        raise _Cancelled()
+                    yield chunk
+            except _Cancelled:
+                raise
+            except Exception as e:
+                raise self._provider_error(e) from e
+
+    async def _achunks(
+        self,
+        stream: AsyncStream[ChatCompletionChunk],
+        first: Optional[ChatCompletionChunk],
+        budget: Optional[_Budget],
+    ) -> AsyncIterator[ChatCompletionChunk]:
+        """Async ``_chunks``, cancelling the calling task closes the stream too."""
+        async with stream:
+            try:
+                if first is not None:
+                    if _expired(budget):
+                        raise _Cancelled()
+                    yield first
+                async for chunk in stream:
+                    if _expired(budget):
+                        raise _Cancelled()
+                    yield chunk
+            except _Cancelled:
+                raise
+            except Exception as e:
+                raise self._provider_error(e) from e
+
+    def _completion(self, state: ChatCompletionStreamState) -> ChatCompletion:
+        """Final completion of a stream, parsed into the response model when it validates.
+
+        A completion the response model rejects, or one cut off at the token limit, is
+        returned unparsed, so its raw text reaches the agent and can be repaired there.
+        """
+        try:
+            completion = state.get_final_completion()
+        except LengthFinishReasonError as e:
+            logger.warning(f"Step '{self.step_name}' hit the token limit, its output is truncated")
+            completion = e.completion
+        except Exception as e:
+            raise self._provider_error(e) from e
+
+        response_model = self._parse_format()
+        message = completion.choices[0].message if completion.choices else None
+        if response_model is not None and message is not None and message.content:
+            try:
+                message.parsed = response_model.model_validate_json(message.content)
+            except ValueError as e:
+                logger.warning(f"Step '{self.step_name}' output does not match {response_model.__name__}: {e}")
+        return completion
+
+    def _complete(self, chunks: Iterator[ChatCompletionChunk]) -> ChatCompletion:
+        """Accumulate streamed chunks into the completion ``invoke`` returns."""
+        state = ChatCompletionStreamState()
+        for chunk in chunks:
+            state.handle_chunk(chunk)
+        return self._completion(state)
+
+    async def _acomplete(self, chunks: AsyncIterator[ChatCompletionChunk]) -> ChatCompletion:
+        state = ChatCompletionStreamState()
+        async for chunk in chunks:
+            state.handle_chunk(chunk)
+        return self._completion(state)
+
+    def _finish(self, name: str, label: str, started: float) -> None:
+        hedge_registry.record(name, time.perf_counter() - started)
+        hedge_registry.update(name, hedge_wins=int(label == "hedge"))
+        if label == "hedge":
+            logger.info(f"Hedged request won for step '{name}' after {time.perf_counter() - started:.1f}s")
+
+    def _deadline_exceeded(self, name: str, budget: Optional[_Budget]) -> StepDeadlineExceeded:
+        """Error for a call that ran out of ``budget``, the budget that was actually enforced."""
+        hedge_registry.update(name, timeouts=1)
+        seconds = f" {budget.seconds:g}s" if budget is not None else ""
+        return StepDeadlineExceeded(f"Step '{self.step_name}' exceeded its{seconds} deadline")
+
+    @staticmethod
+    def _discard(name: str, loser: Future) -> None:
+        """Account for a losing request once it stopped, closing it if it got as far as a stream."""
+        if not loser.cancelled():
+            error = loser.exception()
+            if error is None and isinstance(loser.result(), tuple):
+                loser.result()[0].close()
+            elif not isinstance(error, _Cancelled):
+                return
+        hedge_registry.update(name, cancelled=1)
+
+    @staticmethod
+    def _adiscard(name: str, loser: asyncio.Task) -> None:
+        if not loser.cancelled():
+            error = loser.exception()
+            if error is None and isinstance(loser.result(), tuple):
+                asyncio.ensure_future(loser.result()[0].close())
+            elif not isinstance(error, _Cancelled):
+                return
+        hedge_registry.update(name, cancelled=1)
+
+    def _race(
+        self,
+        name: str,
+        started: float,
+        budget: Optional[_Budget],
+        attempt: Callable[["HedgedOpenAIChat", Optional[threading.Event]], Any],
+    ) -> Any:
+        """Run ``attempt`` and, once the hedge delay of ``name`` passed, race it against a hedge.
+
+        ``attempt`` receives the model to call and an event set when its request lost.
+        """
+        if _expired(budget):
+            raise self._deadline_exceeded(name, budget)
+        delay = self._hedge_delay(name)
+
+        if delay is None:
+            # Nothing to race, run on the calling thread
+            try:
+                result = attempt(self, None)
+            except _Cancelled as e:
+                raise self._deadline_exceeded(name, budget) from e
+            except Exception as e:
+                if _expired(budget):
+                    raise self._deadline_exceeded(name, budget) from e
+                hedge_registry.update(name, errors=1)
+                raise
+            self._finish(name, "primary", started)
+            return result
+
+        pending: Dict[Future, Tuple[str, threading.Event]] = {}
+
+        def launch(model: "HedgedOpenAIChat", label: str) -> None:
+            cancelled = threading.Event()
+            # Run in a copy of the caller's context, as asyncio.to_thread does
+            future = _executor.submit(copy_context().run, attempt, model, cancelled)
+            pending[future] = (label, cancelled)
+
+        launch(self, "primary")
+        hedge_at: Optional[float] = started + delay
+        error: Optional[BaseException] = None
+
+        try:
+            while pending:
+                done, _ = wait(
+                    pending, timeout=_time_until(hedge_at, budget and budget.at), return_when=FIRST_COMPLETED
+                )
+
+                for future in done:
+                    label, _ = pending.pop(future)
+                    if future.exception() is None:
+                        self._finish(name, label, started)
+                        return future.result()
+                    if not isinstance(future.exception(), _Cancelled):
+                        error = future.exception()
+                        hedge_registry.update(name, errors=1)
+
+                if hedge_at is not None and time.perf_counter() >= hedge_at:
+                    hedge_at = None
+                    if pending:
+                        hedge_registry.update(name, hedged=1)
+                        launch(self._hedge_copy(), "hedge")
+                if _expired(budget):
+                    raise self._deadline_exceeded(name, budget) from error
+        finally:
+            # Losers close their stream at the next chunk, or are closed once they opened it
+            for future, (_, cancelled) in pending.items():
+                cancelled.set()
+                future.add_done_callback(functools.partial(self._discard, name))
+
+        assert error is not None
+        raise error
+
+    async def _arace(
+        self,
+        name: str,
+        started: float,
+        budget: Optional[_Budget],
+        attempt: Callable[["HedgedOpenAIChat"], Awaitable[Any]],
+    ) -> Any:
+        """Async ``_race``, losing requests are cancelled."""
+        if _expired(budget):
+            raise self._deadline_exceeded(name, budget)
+        delay = self._hedge_delay(name)
+
+        pending: Dict[asyncio.Task, str] = {asyncio.ensure_future(attempt(self)): "primary"}
+        hedge_at = started + delay if delay is not None else None
+        error: Optional[BaseException] = None
+
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, timeout=_time_until(hedge_at, budget and budget.at), return_when=asyncio.FIRST_COMPLETED
+                )
+
+                for task in done:
+                    label = pending.pop(task)
+                    if task.exception() is None:
+                        self._finish(name, label, started)
+                        return task.result()
+                    if not isinstance(task.exception(), _Cancelled):
+                        error = task.exception()
+                        hedge_registry.update(name, errors=1)
+
+                if hedge_at is not None and time.perf_counter() >= hedge_at:
+                    hedge_at = None
+                    if pending:
+                        hedge_registry.update(name, hedged=1)
+                        pending[asyncio.ensure_future(attempt(self._hedge_copy()))] = "hedge"
+                if _expired(budget):
+                    raise self._deadline_exceeded(name, budget) from error
+        finally:
+            for loser in pending:
+                loser.cancel()
+                loser.add_done_callback(functools.partial(self._adiscard, name))
+
+        assert error is not None
+        raise error
+
+    def invoke(self, messages: List[Message]) -> ChatCompletion:
+        hedge_registry.update(self.step_name, calls=1)
+        started = time.perf_counter()
+        budget = self._budget(started)
+        retries = self._retries()
+
+        def attempt(model: "HedgedOpenAIChat", cancelled: Optional[threading.Event]) -> ChatCompletion:
+            stream, first = model._open(messages, budget, retries, cancelled)
+            return model._complete(model._chunks(stream, first, budget, cancelled))
+
+        return self._race(self.step_name, started, budget, attempt)
+
+    async def ainvoke(self, messages: List[Message]) -> ChatCompletion:
+        hedge_registry.update(self.step_name, calls=1)
+        started = time.perf_counter()
+        budget = self._budget(started)
+        retries = self._retries()
+
+        async def attempt(model: "HedgedOpenAIChat") -> ChatCompletion:
+            stream, first = await model._aopen(messages, budget, retries)
+            return await model._acomplete(model._achunks(stream, first, budget))
+
+        return await self._arace(self.step_name, started, budget, attempt)
+
+    def invoke_stream(self, messages: List[Message]) -> Iterator[ChatCompletionChunk]:
+        name = f"{self.step_name}.stream"
+        hedge_registry.update(name, calls=1)
+        started = time.perf_counter()
+        budget = self._budget(started)
+        retries = self._retries()
+
+        stream, first = self._race(
+            name, started, budget, lambda model, cancelled: model._open(messages, budget, retries, cancelled)
+        )
+        try:
+            yield from self._chunks(stream, first, budget)
+        except _Cancelled as e:
+            raise self._deadline_exceeded(name, budget) from e
+
+    async def ainvoke_stream(self, messages: List[Message]) -> AsyncIterator[ChatCompletionChunk]:
+        name = f"{self.step_name}.stream"
+        hedge_registry.update(name, calls=1)
+        started = time.perf_counter()
+        budget = self._budget(started)
+        retries = self._retries()
+
+        stream, first = await self._arace(name, started, budget, lambda model: model._aopen(messages, budget, retries))
+        chunks = self._achunks(stream, first, budget)
+        try:
+            async for chunk in chunks:
+                yield chunk
+        except _Cancelled as e:
+            raise self._deadline_exceeded(name, budget) from e
+        finally:
+            await chunks.aclose()
+
+
+def hedged_chat(step: str, id: str = "gpt-4o") -> OpenAIChat:
+    """Create a model for a named step, configured from the application settings.
+
+    Args:
+        step: Step name used for latency tracking and deadline lookup, e.g. ``blog.editor``
+        id: Model id of the primary request
+    """
+    return HedgedOpenAIChat(
+        id=id,
+        step=step,
+        hedge_model_id=hedge_model_id,
+        hedge_percentile=hedge_percentile,
+        min_samples=hedge_min_samples,
+        deadline=step_deadlines.get(step, step_deadline_default),
+        hedging=hedging_enabled,
+    )
@@ -0,0 +1,216 @@
+"""
+Model client provider module.
+
+Provides one process-wide, keep-alive HTTP connection pool shared by every OpenAIChat
+model, along with connection-reuse metrics.
+"""
+
+import importlib.util
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import httpx
+from agno.models.openai import OpenAIChat
+from agno.utils.log import logger
+from openai import AsyncOpenAI, OpenAI
+
+from ..config.settings import (
+    http_keepalive_expiry,
+    http_max_connections,
+    http_max_keepalive_connections,
+    http_use_http2,
+)
+
+
+class ConnectionMetrics:
+    """Counts requests and new connections made through the shared pool."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.connections_opened = 0
+        self.tls_handshakes = 0
+        self.connect_seconds = 0.0
+        self.http2_requests = 0
+
+    def add(self, **values: float) -> None:
+        with self._lock:
+            for name, value in values.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "connections_opened": self.connections_opened,
+                "tls_handshakes": self.tls_handshakes,
+                "connection_reuse_ratio": 1 - self.connections_opened / self.requests if self.requests else 0.0,
+                "connect_seconds_total": self.connect_seconds,
+                "connect_seconds_mean": self.connect_seconds / self.connections_opened if self.connections_opened else 0.0,
+                "http2_requests": self.http2_requests,
+            }
+
+
+class _ConnectionTrace:
+    """httpcore ``trace`` callback recording connection setup for one request."""
+
+    def __init__(self, metrics: ConnectionMetrics):
+        self.metrics = metrics
+        self.connect_started: Optional[float] = None
+
+    def record(self, event: str) -> None:
+        if event == "connection.connect_tcp.started":
+            self.connect_started = time.perf_counter()
+        elif event == "connection.connect_tcp.complete":
+            self.metrics.add(connections_opened=1)
+        elif event == "connection.start_tls.complete":
+            self.metrics.add(tls_handshakes=1)
+        elif event.endswith(".send_request_headers.started"):
+            if self.connect_started is not None:
+                self.metrics.add(connect_seconds=time.perf_counter() - self.connect_started)
+                self.connect_started = None
+            if event.startswith("http2."):
+                self.metrics.add(http2_requests=1)
+
+    def __call__(self, event: str, info: Dict[str, Any]) -> None:
+        self.record(event)
+
+
+class _AsyncConnectionTrace(_ConnectionTrace):
+    async def __call__(self, event: str, info: Dict[str, Any]) -> None:
+        self.record(event)
+
+
+@dataclass
+class PoolConfig:
+    """Limits of the shared connection pool."""
+    max_connections: int = 200
+    max_keepalive_connections: int = 50
+    keepalive_expiry: float = 60.0
+    http2: bool = True
+
+
+class ModelClientProvider:
+    """Process-wide provider of OpenAI clients backed by one shared connection pool.
+
+    The sync and async HTTP clients are created lazily, and again after a fork, so each
+    worker process owns its pool. OpenAI clients are cached per set of client params
+    (API key, base URL, ...) and all of them share the same HTTP clients.
+    """
+
+    def __init__(self, config: PoolConfig):
+        self.config = config
+        self.metrics = ConnectionMetrics()
+        self._lock = threading.Lock()
+        self._pid: Optional[int] = None
+        self._http_client: Optional[httpx.Client] = None
+        self._async_http_client: Optional[httpx.AsyncClient] = None
+        self._clients: Dict[str, OpenAI] = {}
+        self._async_clients: Dict[str, AsyncOpenAI] = {}
+
+    @property
+    def http2(self) -> bool:
+        return self.config.http2 and importlib.util.find_spec("h2") is not None
+
+    def _limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.config.max_connections,
+            max_keepalive_connections=self.config.max_keepalive_connections,
+            keepalive_expiry=self.config.keepalive_expiry,
+        )
+
+    def _on_request(self, request: httpx.Request) -> None:
+        self.metrics.add(requests=1)
+        request.extensions["trace"] = _ConnectionTrace(self.metrics)
+
+    async def _on_async_request(self, request: httpx.Request) -> None:
+        self.metrics.add(requests=1)
+        request.extensions["trace"] = _AsyncConnectionTrace(self.metrics)
+
+    def _ensure_pool(self) -> None:
+        # Called with the lock held
+        if self._pid == os.getpid():
+            return
+        if self.config.http2 and not self.http2:
+            logger.warning("HTTP/2 requested but the 'h2' package is not installed, using HTTP/1.1")
+        self._pid = os.getpid()
+        self._http_client = httpx.Client(
+            http2=self.http2, limits=self._limits(), event_hooks={"request": [self._on_request]}
+        )
+        self._async_http_client = httpx.AsyncClient(
+            http2=self.http2, limits=self._limits(), event_hooks={"request": [self._on_async_request]}
+        )
+        self._clients.clear()
+        self._async_clients.clear()
+
+    @staticmethod
+    def _key(client_params: Dict[str, Any]) -> str:
+        return repr(sorted(client_params.items()))
+
+    def get_client(self, client_params: Dict[str, Any]) -> OpenAI:
+        """Shared sync OpenAI client for the given client params."""
+        key = self._key(client_params)
+        with self._lock:
+            self._ensure_pool()
+            if key not in self._clients:
+                self._clients[key] = OpenAI(**client_params, http_client=self._http_client)
+            return self._clients[key]
+
+    def get_async_client(self, client_params: Dict[str, Any]) -> AsyncOpenAI:
+        """Shared async OpenAI client for the given client params."""
+        key = self._key(client_params)
+        with self._lock:
+            self._ensure_pool()
+            if key not in self._async_clients:
+                self._async_clients[key] = AsyncOpenAI(**client_params, http_client=self._async_http_client)
+            return self._async_clients[key]
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "http2": self.http2,
+            "max_connections": self.config.max_connections,
+            "max_keepalive_connections": self.config.max_keepalive_connections,
+            "keepalive_expiry_s": self.config.keepalive_expiry,
+            **self.metrics.snapshot(),
+        }
+
+
+client_provider = ModelClientProvider(
+    PoolConfig(
+        max_connections=http_max_connections,
+        max_keepalive_connections=http_max_keepalive_connections,
+        keepalive_expiry=http_keepalive_expiry,
+        http2=http_use_http2,
+    )
+)
+
+
+@dataclass
+class PooledOpenAIChat(OpenAIChat):
+    """OpenAIChat that takes its clients from the process-wide provider.
+
+    Clients set explicitly on the model (``client``, ``async_client`` or ``http_client``)
+    still take precedence.
+    """
+
+    def get_client(self) -> OpenAI:
+        if self.client or self.http_client is not None:
+            return super().get_client()
+        return client_provider.get_client(self._get_client_params())
+
+    def get_async_client(self) -> AsyncOpenAI:
+        if self.async_client or self.http_client is not None:
+            return super().get_async_client()
+        return client_provider.get_async_client(self._get_client_params())
+
+
+def chat_model(id: str = "gpt-4o") -> OpenAIChat:
+    """Create an OpenAI chat model that uses the shared connection pool.
+
+    Args:
+        id: Model id
+    """
+    return PooledOpenAIChat(id=id)
@@ -0,0 +1,307 @@
+"""
+Request profiling module.
+
+Provides an opt-in ASGI middleware that samples the call stacks serving individual
+requests and a store that keeps the latest profiles on disk, in the pstats format.
+"""
+
+import asyncio
+import io
+import json
+import marshal
+import pstats
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import defaultdict
+from contextvars import Context, ContextVar
+from pathlib import Path
+from types import FrameType
+from typing import Any, Dict, List, Optional, Tuple
+
+from agno.utils.log import logger
+
+# Every sampler walks the stacks of all threads, so only one request is profiled at a time
+# to bound the overhead.
+_profiler_lock = threading.Lock()
+
+# Sampler of the request being profiled. The event loop runs each callback in its task's
+# context, and anyio's threadpool and asyncio.to_thread run jobs in a copy of the caller's,
+# so the jobs carrying this value are the ones working for the profiled request.
+_profiled_request: ContextVar[Optional["StackSampler"]] = ContextVar("profiled_request", default=None)
+
+# Frames that hand work to a thread: the event loop, Starlette's threadpool (anyio) and
+# concurrent.futures executors. Only the frames below them belong to a request.
+_DISPATCHERS = {
+    ("asyncio/base_events.py", "_run_once"),
+    ("anyio/_backends/_asyncio.py", "run"),
+    ("concurrent/futures/thread.py", "_worker"),
+}
+# Frames a dispatcher waits in while it has no work
+_WAITS = {
+    ("selectors.py", "select"),
+    ("queue.py", "get"),
+    ("threading.py", "wait"),
+}
+
+FunctionKey = Tuple[str, int, str]
+
+
+def _frame_key(frame: FrameType) -> FunctionKey:
+    code = frame.f_code
+    return code.co_filename, code.co_firstlineno, code.co_name
+
+
+def _matches(key: FunctionKey, frames) -> bool:
+    filename = key[0].replace("\\", "/")
+    return any(key[2] == name and filename.endswith(suffix) for suffix, name in frames)
+
+
+def _job_context(dispatcher: FrameType) -> Optional[Context]:
+    """Context of the job a dispatcher frame is running, None if it has none of its own."""
+    name = dispatcher.f_code.co_name
+    local = dispatcher.f_locals
+    if name == "_run_once":
+        context = getattr(local.get("handle"), "_context", None)
+    elif name == "run":
+        context = local.get("context")
+    else:
+        # asyncio.to_thread submits a partial of Context.run, hedged requests Context.run itself
+        fn = getattr(local.get("work_item"), "fn", None)
+        context = getattr(getattr(fn, "func", fn), "__self__", None)
+    return context if isinstance(context, Context) else None
+
+
+class StackSampler:
+    """Wall-clock sampling profiler covering the event loop and thread-pool workers.
+
+    cProfile only sees the thread it was enabled on, while sync endpoints, streaming
+    generators and workflow steps run in worker threads. The sampler instead records, at a
+    fixed interval, the stacks of the threads busy with a job that runs in a context where
+    ``_profiled_request`` is this sampler, leaving out work done for other requests. Its
+    ``stats`` follow the pstats layout: times are sampled wall-clock seconds and call counts
+    are sample counts.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        """
+        Args:
+            interval: Seconds between samples
+        """
+        self.interval = interval
+        self.samples = 0
+        self.stats: Dict[FunctionKey, tuple] = {}
+        self._counts: Dict[FunctionKey, List[float]] = defaultdict(lambda: [0, 0.0, 0.0])
+        self._callers: Dict[FunctionKey, Dict[FunctionKey, List[float]]] = defaultdict(
+            lambda: defaultdict(lambda: [0, 0.0, 0.0])
+        )
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            now = time.perf_counter()
+            elapsed, last = now - last, now
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id != own_id:
+                    self._record(frame, elapsed)
+
+    def _job_stack(self, frame: FrameType) -> List[FunctionKey]:
+        """The frames a thread runs for this sampler's request, outermost first, or []."""
+        stack: List[FunctionKey] = []
+        while frame is not None:
+            key = _frame_key(frame)
+            stack.append(key)
+            if _matches(key, _DISPATCHERS):
+                break
+            frame = frame.f_back
+        else:
+            # Not a worker or event loop thread
+            return []
+        stack.reverse()
+        while len(stack) > 1 and _matches(stack[-1], _WAITS):
+            stack.pop()
+        if len(stack) < 2:
+            return []
+        context = _job_context(frame)
+        return stack if context is not None and context.get(_profiled_request) is self else []
+
+    def _record(self, frame: FrameType, elapsed: float) -> None:
+        stack = self._job_stack(frame)
+        if not stack:
+            return
+        self.samples += 1
+        seen = set()
+        for depth, key in enumerate(stack):
+            innermost = depth == len(stack) - 1
+            counts = self._counts[key]
+            if innermost:
+                counts[1] += elapsed
+            if key not in seen:
+                seen.add(key)
+                counts[0] += 1
+                counts[2] += elapsed
+            if depth > 0:
+                edge = self._callers[key][stack[depth - 1]]
+                edge[0] += 1
+                edge[1] += elapsed if innermost else 0.0
+                edge[2] += elapsed
+
+    def create_stats(self) -> None:
+        self.stats = {
+            key: (
+                calls,
+                calls,
+                self_time,
+                total_time,
+                {caller: (n, n, tt, ct) for caller, (n, tt, ct) in self._callers[key].items()},
+            )
+            for key, (calls, self_time, total_time) in self._counts.items()
+        }
+
+    def dump_stats(self, path: str) -> None:
+        self.create_stats()
+        with open(path, "wb") as f:
+            marshal.dump(self.stats, f)
+
+
+class ProfileStore:
+    """Keeps the most recent request profiles in a local directory."""
+
+    def __init__(self, directory: str, keep: int = 20):
+        """
+        Args:
+            directory: Directory the profiles are written to
+            keep: Number of profiles to retain, older ones are deleted
+        """
+        self.directory = Path(directory)
+        self.keep = keep
+
+    def save(self, profiler: StackSampler, metadata: Dict[str, Any]) -> str:
+        """Write a finished profile and its metadata, then prune old profiles."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        profile_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        profiler.dump_stats(str(self.directory / f"{profile_id}.prof"))
+        metadata = {"profile_id": profile_id, **metadata}
+        (self.directory / f"{profile_id}.json").write_text(json.dumps(metadata, indent=2))
+        self._prune()
+        logger.info(f"Saved profile {profile_id} for {metadata.get('method')} {metadata.get('path')}")
+        return profile_id
+
+    def _prune(self) -> None:
+        profiles = sorted(self.directory.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
+        for stale in profiles[self.keep:]:
+            stale.unlink(missing_ok=True)
+            stale.with_suffix(".prof").unlink(missing_ok=True)
+
+    def list(self) -> List[Dict[str, Any]]:
+        """Metadata of the stored profiles, newest first."""
+        if not self.directory.exists():
+            return []
+        profiles = sorted(self.directory.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
+        return [json.loads(p.read_text()) for p in profiles]
+
+    def path(self, profile_id: str) -> Optional[Path]:
+        """Path of the raw ``.prof`` file, or None if the profile does not exist."""
+        # Only accept ids that resolve to a file directly inside the store
+        candidate = self.directory / f"{Path(profile_id).name}.prof"
+        return candidate if candidate.exists() else None
+
+    def summary(self, profile_id: str, sort: str = "cumulative", limit: int = 50) -> Optional[str]:
+        """Human-readable pstats report of a stored profile."""
+        path = self.path(profile_id)
+        if path is None:
+            return None
+        out = io.StringIO()
+        pstats.Stats(str(path), stream=out).strip_dirs().sort_stats(sort).print_stats(limit)
+        return out.getvalue()
+
+
+class ProfilingMiddleware:
+    """ASGI middleware that profiles requests selected by header or sampling rate.
+
+    Sampling covers the event loop and the threadpool running sync endpoints, streaming
+    generators and workflow steps, until the last body chunk is sent or the client
+    disconnects. Only jobs running in the request's context are sampled, so work done for
+    other concurrent requests in the meantime is left out.
+    """
+
+    def __init__(
+        self,
+        app,
+        store: ProfileStore,
+        sample_rate: float = 0.0,
+        header: str = "X-Profile",
+        interval: float = 0.005,
+    ):
+        self.app = app
+        self.store = store
+        self.sample_rate = sample_rate
+        self.header = header.lower().encode()
+        self.interval = interval
+
+    def _should_profile(self, scope) -> bool:
+        for name, value in scope.get("headers", ()):
+            if name == self.header:
+                return value.lower() in (b"1", b"true", b"yes")
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+        if not _profiler_lock.acquire(blocking=False):
+            logger.debug(f"Skipping profile of {scope['path']}, another request is being profiled")
+            await self.app(scope, receive, send)
+            return
+
+        profiler = StackSampler(self.interval)
+        state: Dict[str, Any] = {"status": None, "done": False}
+        started = time.perf_counter()
+
+        async def finish() -> None:
+            if state["done"]:
+                return
+            state["done"] = True
+            await asyncio.to_thread(profiler.stop)
+            _profiler_lock.release()
+            metadata = {
+                "method": scope["method"],
+                "path": scope["path"],
+                "status": state["status"],
+                "duration_s": time.perf_counter() - started,
+                "samples": profiler.samples,
+                "created_at": time.time(),
+            }
+            try:
+                await asyncio.to_thread(self.store.save, profiler, metadata)
+            except OSError as e:
+                logger.warning(f"Could not save profile for {scope['path']}: {e}")
+
+        async def send_wrapper(message) -> None:
+            if message["type"] == "http.response.start":
+                state["status"] = message["status"]
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                await finish()
+
+        token = _profiled_request.set(profiler)
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            await finish()
+            _profiled_request.reset(token)
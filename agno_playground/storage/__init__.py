@@ -0,0 +1,10 @@
+"""
+Storage package.
+
+This package provides the session and result stores used by agents and workflows.
+"""
+
+from .post_cache import PostCache
+from .sharded import ShardedSqliteStorage
+
+__all__ = ["PostCache", "ShardedSqliteStorage"]
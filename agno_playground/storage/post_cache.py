@@ -0,0 +1,58 @@
+"""
+Post cache module.
+
+Defines a persistent cache of finished posts shared by every user and session.
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+
+class PostCache:
+    """SQLite-backed cache of finished posts, keyed by the request that produced them.
+
+    Requests are matched case-insensitively with whitespace collapsed. Each thread uses its
+    own connection and the database runs in WAL mode, so lookups do not block each other.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: SQLite file holding the cache
+        """
+        self.path = Path(path)
+        self._local = threading.local()
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS posts (key TEXT PRIMARY KEY, content TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    @staticmethod
+    def key_for(request: str) -> str:
+        return " ".join(request.lower().split())
+
+    def get(self, request: str) -> Optional[str]:
+        """Cached post for a request, or None."""
+        row = self._connect().execute("SELECT content FROM posts WHERE key = ?", (self.key_for(request),)).fetchone()
+        return row[0] if row else None
+
+    def put(self, request: str, content: str) -> None:
+        """Cache the post produced for a request, replacing any earlier one."""
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO posts (key, content, created_at) VALUES (?, ?, ?)",
+                (self.key_for(request), content, time.time()),
+            )
@@ -0,0 +1,126 @@
+"""
+Sharded session storage module.
+
+Spreads agent, team and workflow sessions over several SQLite files by session id, so
+concurrent sessions do not queue on a single database write lock.
+"""
+
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import List, Literal, Optional, Set
+
+from agno.storage.base import Storage
+from agno.storage.session import Session
+from agno.storage.sqlite import SqliteStorage
+
+_prepared: Set[str] = set()
+_prepared_lock = threading.Lock()
+
+
+def shard_url(path: Path) -> str:
+    """Database URL of one shard file, switching the file to WAL mode on first use."""
+    path = path.resolve()
+    with _prepared_lock:
+        if str(path) not in _prepared:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # WAL is persistent and lets readers proceed while a session is being written
+            with sqlite3.connect(path) as connection:
+                connection.execute("PRAGMA journal_mode=WAL")
+            _prepared.add(str(path))
+    return f"sqlite:///{path}?timeout=30"
+
+
+class ShardedSqliteStorage(Storage):
+    """SQLite storage whose sessions are spread over ``shards`` database files.
+
+    A session always lives in the shard picked by a hash of its id. Storages created with
+    the same ``db_dir`` share the shard files, so a workflow and its step agents keep the
+    rows of one session in the same file. Listing sessions merges all shards.
+    """
+
+    def __init__(
+        self,
+        table_name: str,
+        db_dir: str,
+        shards: int = 8,
+        mode: Optional[Literal["agent", "team", "workflow"]] = "agent",
+    ):
+        """
+        Args:
+            table_name: Table storing the sessions, created in every shard
+            db_dir: Directory holding the shard files
+            shards: Number of shard files
+            mode: Kind of sessions stored
+        """
+        self.table_name = table_name
+        self.db_dir = Path(db_dir)
+        # The shards get their mode here, set before super().__init__ so the mode setter
+        # does not rebuild their tables a second time
+        self.shards: List[SqliteStorage] = [
+            SqliteStorage(
+                table_name=table_name,
+                db_url=shard_url(self.db_dir / f"shard-{index:02d}.db"),
+                mode=mode,
+            )
+            for index in range(max(1, shards))
+        ]
+        super().__init__(mode)
+        # Shards are shared by every copy of their agent or workflow, create the tables up
+        # front rather than racing on the lazy creation of the first concurrent reads
+        self.create()
+
+    @property
+    def mode(self) -> Literal["agent", "team", "workflow"]:
+        return self._mode
+
+    @mode.setter
+    def mode(self, value: Optional[Literal["agent", "team", "workflow"]]) -> None:
+        # agno sets the mode before every run, and a shard rebuilds its table metadata
+        # whenever its mode is set, so only pass actual changes on to the shards
+        value = "agent" if value is None else value
+        if getattr(self, "_mode", None) == value:
+            return
+        self._mode = value
+        for shard in getattr(self, "shards", []):
+            if shard.mode != value:
+                shard.mode = value
+
+    def __deepcopy__(self, memo):
+        # Holds no per-session state, copies of an agent or workflow can share it
+        return self
+
+    def shard_for(self, session_id: str) -> SqliteStorage:
+        digest = hashlib.blake2b(session_id.encode(), digest_size=8).digest()
+        return self.shards[int.from_bytes(digest, "little") % len(self.shards)]
+
+    def create(self) -> None:
+        for shard in self.shards:
+            shard.create()
+
+    def read(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
+        return self.shard_for(session_id).read(session_id, user_id)
+
+    def get_all_session_ids(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
+        return [session.session_id for session in self.get_all_sessions(user_id, entity_id)]
+
+    def get_all_sessions(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[Session]:
+        sessions = [session for shard in self.shards for session in shard.get_all_sessions(user_id, entity_id)]
+        return sorted(sessions, key=lambda session: session.created_at or 0, reverse=True)
+
+    def upsert(self, session: Session) -> Optional[Session]:
+        return self.shard_for(session.session_id).upsert(session)
+
+    def delete_session(self, session_id: Optional[str] = None):
+        if session_id is None:
+            return
+        self.shard_for(session_id).delete_session(session_id)
+
+    def drop(self) -> None:
+        for shard in self.shards:
+            shard.drop()
+
+    def upgrade_schema(self) -> None:
+        for shard in self.shards:
+            shard.upgrade_schema()
@@ -16,9 +16,11 @@ from ..agents.content import (
     social_media_manager
 )
 from ..config.settings import agent_storage
+from ..models import chat_model
 
 content_team = Team(
     name="Content Team",
+    model=chat_model("gpt-4o"),
     description=dedent("""\
     A specialized team of content professionals who collaborate to create, 
     optimize, and distribute high-quality content across various channels.
@@ -10,9 +10,11 @@ from agno.team import Team
 from ..agents.content import social_media_manager, seo_specialist
 from ..agents.marketing import marketing_strategist, market_researcher
 from ..config.settings import agent_storage
+from ..models import chat_model
 
 marketing_team = Team(
     name="Marketing Team",
+    model=chat_model("gpt-4o"),
     description="A collaborative team of marketing professionals who develop and execute marketing strategies.",
     members=[
         marketing_strategist,
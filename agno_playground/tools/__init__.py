@@ -0,0 +1,9 @@
+"""
+Tools package.
+
+This package provides custom toolkits used by the application's agents.
+"""
+
+from .code_index import CodeIndexTools
+
+__all__ = ["CodeIndexTools"]
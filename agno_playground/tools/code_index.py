@@ -0,0 +1,115 @@
+"""
+Code index tools module.
+
+Exposes a local CodeIndex to agents as search, symbol lookup and file reading tools.
+"""
+
+import json
+import time
+from dataclasses import asdict
+from typing import Optional
+
+from agno.tools import Toolkit
+
+from ..knowledge import CodeIndex
+
+
+class CodeIndexTools(Toolkit):
+    """Toolkit answering code questions from a local index of a source tree.
+
+    The index is built on the first call, or earlier if it was started at application
+    startup, and every result reports how long the lookup took.
+    """
+
+    def __init__(self, index: CodeIndex, max_read_lines: int = 400, ready_timeout: float = 120.0, **kwargs):
+        """
+        Args:
+            index: Index the tools query
+            max_read_lines: Maximum number of lines returned by ``read_code_file``
+            ready_timeout: Seconds to wait for the initial build before answering from a partial index
+        """
+        self.index = index
+        self.max_read_lines = max_read_lines
+        self.ready_timeout = ready_timeout
+        tools = [self.search_code, self.find_symbol, self.list_file_symbols, self.read_code_file, self.code_index_status]
+        super().__init__(name="code_index", tools=tools, **kwargs)
+
+    def _ready(self) -> None:
+        self.index.ensure_ready(self.ready_timeout)
+
+    @staticmethod
+    def _result(started: float, **payload) -> str:
+        return json.dumps({**payload, "took_ms": round((time.perf_counter() - started) * 1000, 3)}, indent=2)
+
+    def search_code(self, query: str, max_results: int = 20, path_prefix: str = "") -> str:
+        """Use this function to find lines of the codebase containing some text, like grep.
+
+        Args:
+            query (str): Literal text to search for, case-insensitive, e.g. a function name or an error message.
+            max_results (optional, default=20): The maximum number of matching lines to return.
+            path_prefix (optional, default=""): Only search files under this path, e.g. "agno_playground/workflows".
+
+        Returns:
+            The matching lines with their file path and line number.
+        """
+        self._ready()
+        started = time.perf_counter()
+        matches = self.index.search(query, limit=max_results, path_prefix=path_prefix)
+        return self._result(started, matches=[asdict(match) for match in matches])
+
+    def find_symbol(self, name: str, kind: Optional[str] = None, max_results: int = 10) -> str:
+        """Use this function to find where a Python class, function, method or variable is defined.
+
+        Args:
+            name (str): Symbol name, or a dotted name like "BlogPostGenerator.run" to match qualified names.
+            kind (optional): Only return one kind of symbol: "class", "function", "method", "variable" or "attribute".
+            max_results (optional, default=10): The maximum number of symbols to return.
+
+        Returns:
+            The matching symbols with their file path, line number, signature and docstring summary.
+        """
+        self._ready()
+        started = time.perf_counter()
+        symbols = self.index.find_symbols(name, kind=kind, limit=max_results)
+        return self._result(started, symbols=[asdict(symbol) for symbol in symbols])
+
+    def list_file_symbols(self, path: str) -> str:
+        """Use this function to get an outline of the classes, functions and variables defined in a Python file.
+
+        Args:
+            path (str): Path of the file relative to the repository root.
+
+        Returns:
+            The symbols defined in the file, in source order.
+        """
+        self._ready()
+        started = time.perf_counter()
+        symbols = self.index.outline(path)
+        return self._result(started, path=path, symbols=[asdict(symbol) for symbol in symbols])
+
+    def read_code_file(self, path: str, start_line: int = 1, end_line: Optional[int] = None) -> str:
+        """Use this function to read lines of a file from the codebase.
+
+        Args:
+            path (str): Path of the file relative to the repository root.
+            start_line (optional, default=1): First line to return.
+            end_line (optional): Last line to return, defaults to the end of the file within the line limit.
+
+        Returns:
+            The requested lines, prefixed with their line numbers.
+        """
+        self._ready()
+        start_line = max(1, start_line)
+        end_line = min(end_line or start_line + self.max_read_lines - 1, start_line + self.max_read_lines - 1)
+        content = self.index.read(path, start_line, end_line)
+        if content is None:
+            return f"File not found in the code index: {path}"
+        return content
+
+    def code_index_status(self) -> str:
+        """Use this function to check which repository is indexed, how large the index is and how fast it was built.
+
+        Returns:
+            The index root, file and symbol counts, and the statistics of the last indexing pass.
+        """
+        return json.dumps(self.index.status(), indent=2)
@@ -5,21 +5,34 @@ This module defines the BlogPostGenerator workflow which orchestrates multiple a
 to generate well-researched and engaging blog posts.
 """
 
+import copy
 import json
+import typing
 from textwrap import dedent
-from typing import Dict, Iterator, Optional
+from typing import Any, Dict, Iterator, List, Literal, Optional, Tuple, Type
 
 from agno.agent import Agent, RunResponse
-from agno.models.openai import OpenAIChat
-from agno.storage.sqlite import SqliteStorage
 from agno.tools.duckduckgo import DuckDuckGoTools
 # Temporarily commenting out FilesystemTools as it might not be available in your version
 # from agno.tools.filesystem import FilesystemTools
 from agno.utils.log import logger
 from agno.workflow import RunEvent, Workflow
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator, model_validator
 
-from ..config.settings import agent_storage
+from ..config.settings import (
+    blog_edit_mode,
+    blog_post_cache_path,
+    research_index_min_hits,
+    research_index_path,
+    research_index_ttl_days,
+    session_dir,
+    session_shards,
+)
+from ..knowledge import ResearchIndex
+from ..models import StepDeadlineExceeded, hedged_chat, step_deadline
+from ..storage import PostCache, ShardedSqliteStorage
+from .patching import PatchError, apply_edits
+from .repair import coerce_model, coerce_model_list, list_model, partial_model, split_fields
 
 
 class BlogTopic(BaseModel):
@@ -29,16 +42,56 @@ class BlogTopic(BaseModel):
     keywords: list[str] = Field(..., description="Relevant keywords for the topic.")
 
 
+class BlogSection(BaseModel):
+    """Model representing a single section of a blog outline."""
+    title: str = Field(..., description="Heading of the section.")
+    description: str = Field(..., description="Brief description of what the section should cover.")
+
+    @model_validator(mode="before")
+    @classmethod
+    def coerce_loose_shape(cls, data: Any) -> Any:
+        """Accept bare headings and the key names models commonly use instead of ours."""
+        if isinstance(data, str):
+            return {"title": data, "description": ""}
+        if not isinstance(data, dict):
+            return data
+        data = dict(data)
+        for alias in ("heading", "name", "section", "section_title"):
+            if "title" not in data and alias in data:
+                data["title"] = data.pop(alias)
+        for alias in ("content", "summary", "details", "key_points", "points", "subsections"):
+            if "description" not in data and alias in data:
+                data["description"] = data.pop(alias)
+        description = data.get("description", "")
+        if isinstance(description, list):
+            description = "; ".join(str(item) for item in description)
+        data["description"] = str(description) if description is not None else ""
+        return data
+
+
 class BlogOutline(BaseModel):
     """Model representing a blog outline with sections and structure."""
     title: str = Field(..., description="Title of the blog post.")
     subtitle: Optional[str] = Field(None, description="Subtitle or tagline for the blog post.")
-    sections: list[dict] = Field(
+    sections: list[BlogSection] = Field(
         ...,
         description="List of sections, each with a title and brief description of content."
     )
     target_word_count: int = Field(..., description="Target word count for the full blog post.")
 
+    @field_validator("sections", mode="before")
+    @classmethod
+    def coerce_sections(cls, sections: Any) -> Any:
+        """Accept a single section or a mapping of section titles to descriptions."""
+        if not isinstance(sections, dict):
+            return sections
+        if "title" in sections or "heading" in sections:
+            return [sections]
+        return [
+            {"title": title, **body} if isinstance(body, dict) else {"title": title, "description": body}
+            for title, body in sections.items()
+        ]
+
 
 class BlogReference(BaseModel):
     """Model representing a reference source for blog content."""
@@ -47,6 +100,27 @@ class BlogReference(BaseModel):
     key_points: list[str] = Field(..., description="Key points from this reference to incorporate.")
 
 
+class BlogResearch(BaseModel):
+    """Model representing the references gathered for a blog post."""
+    references: list[BlogReference] = Field(..., description="Reference sources supporting the blog post.")
+
+
+class BlogEdit(BaseModel):
+    """Model representing a single anchored edit to a blog draft."""
+    operation: Literal["replace", "insert_after", "delete"] = Field(
+        ..., description="Whether to replace the anchor, insert text after it, or delete it."
+    )
+    anchor: str = Field(
+        ..., description="Exact, verbatim span of the draft the edit applies to. Must occur only once in the draft."
+    )
+    text: str = Field(..., description="Replacement or inserted text. Empty for delete.")
+
+
+class BlogEdits(BaseModel):
+    """Model representing the edits an editor makes to a blog draft."""
+    edits: list[BlogEdit] = Field(..., description="Edits to apply to the draft, in order.")
+
+
 class BlogPostGenerator(Workflow):
     """Workflow for generating well-researched and engaging blog posts."""
 
@@ -59,7 +133,7 @@ class BlogPostGenerator(Workflow):
     # Topic Research Agent: Finds trending and relevant topics
     topic_researcher = Agent(
         name="Topic Researcher",
-        model=OpenAIChat(id="gpt-4o"),
+        model=hedged_chat("blog.topic_researcher"),
         tools=[DuckDuckGoTools()],
         description=dedent("""\
         You are a research specialist who identifies trending and relevant blog topics.
@@ -71,7 +145,7 @@ class BlogPostGenerator(Workflow):
             "Provide supporting data when available",
             "Consider topics with a unique angle or perspective"
         ],
-        storage=SqliteStorage(table_name="topic_researcher", db_file=agent_storage),
+        storage=ShardedSqliteStorage(table_name="topic_researcher", db_dir=session_dir, shards=session_shards),
         response_model=BlogTopic,
         structured_outputs=True,
         markdown=True,
@@ -80,7 +154,7 @@ class BlogPostGenerator(Workflow):
     # Content Planner Agent: Creates outlines and plans content structure
     content_planner = Agent(
         name="Content Planner",
-        model=OpenAIChat(id="gpt-4o"),
+        model=hedged_chat("blog.content_planner"),
         description=dedent("""\
         You are a content planner who excels at structuring blog posts for maximum engagement.
         Your expertise includes creating logical flow, identifying key sections, and planning content structure.
@@ -92,7 +166,7 @@ class BlogPostGenerator(Workflow):
             "Plan for proper introduction and conclusion sections",
             "Consider SEO-friendly structure"
         ],
-        storage=SqliteStorage(table_name="content_planner", db_file=agent_storage),
+        storage=ShardedSqliteStorage(table_name="content_planner", db_dir=session_dir, shards=session_shards),
         response_model=BlogOutline,
         structured_outputs=True,
         markdown=True,
@@ -101,7 +175,7 @@ class BlogPostGenerator(Workflow):
     # Research Assistant Agent: Gathers supporting information and references
     research_assistant = Agent(
         name="Research Assistant",
-        model=OpenAIChat(id="gpt-4o"),
+        model=hedged_chat("blog.research_assistant"),
         tools=[DuckDuckGoTools()],
         description=dedent("""\
         You are a detail-oriented research assistant who finds accurate information and references.
@@ -114,8 +188,8 @@ class BlogPostGenerator(Workflow):
             "Look for unique insights not covered in common sources",
             "Verify information accuracy"
         ],
-        storage=SqliteStorage(table_name="research_assistant", db_file=agent_storage),
-        response_model=list[BlogReference],
+        storage=ShardedSqliteStorage(table_name="research_assistant", db_dir=session_dir, shards=session_shards),
+        response_model=BlogResearch,
         structured_outputs=True,
         markdown=True,
     )
@@ -123,7 +197,7 @@ class BlogPostGenerator(Workflow):
     # Blog Writer Agent: Writes engaging and informative content
     blog_writer = Agent(
         name="Blog Writer",
-        model=OpenAIChat(id="gpt-4o"),
+        model=hedged_chat("blog.blog_writer"),
         description=dedent("""\
         You are an expert blog writer who creates engaging, informative, and well-structured content.
         Your expertise includes crafting compelling narratives while incorporating research seamlessly.
@@ -136,14 +210,14 @@ class BlogPostGenerator(Workflow):
             "Write for readability with appropriate paragraph length",
             "Include proper citations and attributions"
         ],
-        storage=SqliteStorage(table_name="blog_writer", db_file=agent_storage),
+        storage=ShardedSqliteStorage(table_name="blog_writer", db_dir=session_dir, shards=session_shards),
         markdown=True,
     )
 
     # Editor Agent: Refines and polishes content
     editor = Agent(
         name="Editor",
-        model=OpenAIChat(id="gpt-4o"),
+        model=hedged_chat("blog.editor"),
         description=dedent("""\
         You are a meticulous editor who refines content for clarity, flow, and accuracy.
         Your expertise includes improving readability while maintaining the original voice.
@@ -156,14 +230,38 @@ class BlogPostGenerator(Workflow):
             "Verify all facts and citations",
             "Enhance transitions between sections"
         ],
-        storage=SqliteStorage(table_name="editor", db_file=agent_storage),
+        storage=ShardedSqliteStorage(table_name="editor", db_dir=session_dir, shards=session_shards),
         markdown=True,
     )
 
+    # Patch Editor Agent: Refines content through anchored edits instead of a full rewrite
+    patch_editor = Agent(
+        name="Patch Editor",
+        model=hedged_chat("blog.patch_editor"),
+        description=dedent("""\
+        You are a meticulous editor who refines content for clarity, flow, and accuracy.
+        You return targeted edits to the draft instead of rewriting it.
+        """),
+        instructions=[
+            "Check for grammar, spelling, and punctuation",
+            "Improve clarity and flow of content",
+            "Ensure consistent tone throughout",
+            "Enhance transitions between sections",
+            "Only edit the sentences that need it and leave everything else untouched",
+            "Copy each anchor verbatim from the draft, long enough to occur exactly once",
+        ],
+        storage=ShardedSqliteStorage(table_name="patch_editor", db_dir=session_dir, shards=session_shards),
+        response_model=BlogEdits,
+        structured_outputs=True,
+    )
+
+    # "patch" applies anchored edits locally, "rewrite" has the editor re-emit the draft
+    edit_mode: str = blog_edit_mode
+
     # Publisher Agent: Formats and prepares content for publishing
     publisher = Agent(
         name="Publisher",
-        model=OpenAIChat(id="gpt-4o"),
+        model=hedged_chat("blog.publisher"),
         # Temporarily commenting out FilesystemTools
         # tools=[FilesystemTools()],
         description=dedent("""\
@@ -177,10 +275,25 @@ class BlogPostGenerator(Workflow):
             "Prepare content for various platforms",
             "Save formatted content to the file system"
         ],
-        storage=SqliteStorage(table_name="publisher", db_file=agent_storage),
+        storage=ShardedSqliteStorage(table_name="publisher", db_dir=session_dir, shards=session_shards),
         markdown=True,
     )
 
+    def __post_init__(self):
+        # Each workflow instance runs its own copies of the step agents, so concurrent
+        # sessions do not share agent state
+        for name, value in vars(type(self)).items():
+            if isinstance(value, Agent):
+                setattr(self, name, value.deep_copy(update={"session_id": self.session_id}))
+
+    def update_agent_session_ids(self):
+        # Step agents are instance attributes rather than dataclass fields, and their
+        # sessions also belong to the workflow's user
+        for value in vars(self).values():
+            if isinstance(value, Agent):
+                value.session_id = self.session_id
+                value.user_id = self.user_id
+
     def run(
         self,
         user_input: str,
@@ -209,79 +322,105 @@ class BlogPostGenerator(Workflow):
         # Step 1: Research topic and generate ideas
         yield RunResponse(
             content="Step 1/6: Researching blog topic...",
-            event=RunEvent.workflow_step_started
+            event=RunEvent.run_response
         )
         
-        topic_response = self.topic_researcher.run(
+        # Let the researcher build on sources gathered by earlier runs
+        related = research_index.search(user_input, limit=5)
+        related_sources = "".join(f"\n- {doc.title}: {'; '.join(doc.key_points[:2])}" for doc, _ in related)
+        
+        topic = self.run_structured(
+            self.topic_researcher,
             f"Research and suggest a blog topic based on: {user_input}. "
             f"Provide a compelling title, brief summary, and relevant keywords."
+            + (f"\n\nSources researched previously on related subjects:{related_sources}" if related else ""),
+            BlogTopic,
         )
         
-        if not topic_response or not isinstance(topic_response.content, BlogTopic):
+        if topic is None:
             yield RunResponse(
                 content="Failed to generate blog topic. Please try again.",
                 event=RunEvent.workflow_completed
             )
             return
         
-        topic = topic_response.content
         logger.info(f"Generated blog topic: {topic.title}")
         
         # Step 2: Create detailed outline
         yield RunResponse(
             content="Step 2/6: Creating blog outline...",
-            event=RunEvent.workflow_step_started
+            event=RunEvent.run_response
         )
         
-        outline_response = self.content_planner.run(
+        outline = self.run_structured(
+            self.content_planner,
             f"Create a detailed outline for a blog post titled '{topic.title}' "
             f"about {topic.summary}. Include engaging section headings and brief "
-            f"descriptions of what each section should cover."
+            f"descriptions of what each section should cover.",
+            BlogOutline,
         )
         
-        if not outline_response or not isinstance(outline_response.content, BlogOutline):
+        if outline is None:
             yield RunResponse(
                 content="Failed to create blog outline. Please try again.",
                 event=RunEvent.workflow_completed
             )
             return
         
-        outline = outline_response.content
         logger.info(f"Created blog outline with {len(outline.sections)} sections")
         
         # Step 3: Gather supporting research
         yield RunResponse(
             content="Step 3/6: Gathering supporting research...",
-            event=RunEvent.workflow_step_started
+            event=RunEvent.run_response
         )
         
-        # Prepare section descriptions for research
-        section_descriptions = "\n".join([
-            f"- {section.get('title')}: {section.get('description')}"
-            for section in outline.sections
-        ])
-        
-        research_response = self.research_assistant.run(
-            f"Find supporting information, statistics, and expert opinions for a blog post "
-            f"titled '{outline.title}' with the following sections:\n\n{section_descriptions}\n\n"
-            f"For each section, provide at least 2-3 key points with relevant facts, statistics, "
-            f"or expert opinions that can be incorporated into the content."
+        # Reuse references from earlier runs and only research the sections they don't cover
+        known_references, gap_sections = self.lookup_research(outline)
+        logger.info(
+            f"Research index covered {len(outline.sections) - len(gap_sections)}/{len(outline.sections)} "
+            f"sections with {len(known_references)} references"
         )
         
-        if not research_response or not isinstance(research_response.content, list):
-            yield RunResponse(
-                content="Failed to gather research. Continuing with limited references.",
-                event=RunEvent.workflow_step_completed
+        new_references = []
+        if gap_sections:
+            # Prepare section descriptions for research
+            section_descriptions = "\n".join([
+                f"- {section.title}: {section.description}"
+                for section in gap_sections
+            ])
+            known_titles = "".join(f"\n- {ref.title}" for ref in known_references)
+            
+            new_references = self.run_structured(
+                self.research_assistant,
+                f"Find supporting information, statistics, and expert opinions for a blog post "
+                f"titled '{outline.title}' with the following sections:\n\n{section_descriptions}\n\n"
+                f"For each section, provide at least 2-3 key points with relevant facts, statistics, "
+                f"or expert opinions that can be incorporated into the content."
+                + (f"\n\nThese sources are already known, do not repeat them:{known_titles}" if known_references else ""),
+                list[BlogReference],
             )
-            references = []
-        else:
-            references = research_response.content
-            logger.info(f"Gathered {len(references)} research references")
+            
+            if new_references is None:
+                new_references = []
+                if not known_references:
+                    yield RunResponse(
+                        content="Failed to gather research. Continuing with limited references.",
+                        event=RunEvent.run_response
+                    )
+            else:
+                research_index.add([ref.model_dump() for ref in new_references], topic=topic.title)
+        
+        references = list({
+            ResearchIndex.doc_id_for(ref.title, ref.url): ref
+            for ref in known_references + new_references
+        }.values())
+        logger.info(f"Gathered {len(references)} research references ({len(new_references)} new)")
         
         # Step 4: Write the blog post draft
         yield RunResponse(
             content="Step 4/6: Writing blog post draft...",
-            event=RunEvent.workflow_step_started
+            event=RunEvent.run_response
         )
         
         # Prepare the input for the writer
@@ -289,12 +428,13 @@ class BlogPostGenerator(Workflow):
             "title": outline.title,
             "subtitle": outline.subtitle,
             "target_word_count": outline.target_word_count,
-            "outline": outline.sections,
+            "outline": [section.model_dump() for section in outline.sections],
             "references": [ref.model_dump() for ref in references] if references else [],
             "keywords": topic.keywords
         }
         
-        draft_response = self.blog_writer.run(
+        draft_response = self.run_step(
+            self.blog_writer,
             f"Write a comprehensive blog post based on the following outline and research:\n\n"
             f"{json.dumps(writer_input, indent=2)}\n\n"
             f"Write an engaging, informative post that follows the outline structure. "
@@ -315,31 +455,19 @@ class BlogPostGenerator(Workflow):
         # Step 5: Edit and refine the content
         yield RunResponse(
             content="Step 5/6: Editing and refining content...",
-            event=RunEvent.workflow_step_started
+            event=RunEvent.run_response
         )
         
-        edit_response = self.editor.run(
-            f"Edit and refine the following blog post draft:\n\n"
-            f"{draft_content}\n\n"
-            f"Improve clarity, fix any grammar issues, ensure consistent tone, "
-            f"and enhance readability. Maintain the original voice while making "
-            f"the content more engaging and professional."
-        )
-        
-        if not edit_response or not edit_response.content:
-            logger.warning("Editing failed, using unedited draft")
-            edited_content = draft_content
-        else:
-            edited_content = edit_response.content
-            logger.info("Successfully edited and refined blog content")
+        edited_content = self.edit_draft(draft_content)
         
         # Step 6: Format and publish
         yield RunResponse(
             content="Step 6/6: Formatting final blog post...",
-            event=RunEvent.workflow_step_started
+            event=RunEvent.run_response
         )
         
-        publish_response = self.publisher.run(
+        publish_response = self.run_step(
+            self.publisher,
             f"Format the following blog post for publishing:\n\n"
             f"{edited_content}\n\n"
             f"Ensure proper markdown formatting with appropriate headings, "
@@ -363,22 +491,204 @@ class BlogPostGenerator(Workflow):
             event=RunEvent.workflow_completed
         )
 
+    def edit_draft(self, draft_content: str) -> str:
+        """
+        Edit a blog draft, through local patches when possible.
+        
+        In patch mode the patch editor returns anchored edits that are applied to the draft
+        locally. If they cannot be applied, the editor rewrites the full draft instead.
+        
+        Args:
+            draft_content: Draft written by the blog writer
+        
+        Returns:
+            The edited draft, or the unedited draft if editing failed
+        """
+        if self.edit_mode == "patch":
+            plan = self.run_structured(
+                self.patch_editor,
+                f"Edit and refine the following blog post draft:\n\n"
+                f"{draft_content}\n\n"
+                f"Improve clarity, fix any grammar issues, ensure consistent tone, "
+                f"and enhance readability. Return only the edits, anchored on verbatim "
+                f"spans of the draft.",
+                BlogEdits,
+            )
+            if plan is not None:
+                try:
+                    edited_content = apply_edits(draft_content, plan.edits)
+                    logger.info(f"Successfully applied {len(plan.edits)} edits to the blog draft")
+                    return edited_content
+                except PatchError as e:
+                    logger.warning(f"Could not apply edits, falling back to a full rewrite: {e}")
+        
+        edit_response = self.run_step(
+            self.editor,
+            f"Edit and refine the following blog post draft:\n\n"
+            f"{draft_content}\n\n"
+            f"Improve clarity, fix any grammar issues, ensure consistent tone, "
+            f"and enhance readability. Maintain the original voice while making "
+            f"the content more engaging and professional."
+        )
+        
+        if not edit_response or not edit_response.content:
+            logger.warning("Editing failed, using unedited draft")
+            return draft_content
+        logger.info("Successfully edited and refined blog content")
+        return edit_response.content
+
+    def lookup_research(self, outline: BlogOutline) -> Tuple[List[BlogReference], List[BlogSection]]:
+        """
+        Find indexed references for each outline section.
+        
+        Args:
+            outline: Blog outline whose sections need supporting research
+        
+        Returns:
+            The distinct references found, and the sections that still need web research
+        """
+        known: Dict[str, BlogReference] = {}
+        gaps = []
+        for section in outline.sections:
+            hits = research_index.search(
+                f"{outline.title} {section.title} {section.description}",
+                limit=research_index_min_hits * 2,
+            )
+            for doc, _ in hits:
+                known.setdefault(doc.doc_id, BlogReference(title=doc.title, url=doc.url, key_points=doc.key_points))
+            if len(hits) < research_index_min_hits:
+                gaps.append(section)
+        return list(known.values()), gaps
+
+    def run_step(self, agent: Agent, prompt: str) -> Optional[RunResponse]:
+        """
+        Run a step agent, returning None if the step exceeds its latency budget.
+        
+        The budget covers the whole run, tool calls included, not each model call alone.
+        """
+        try:
+            with step_deadline(getattr(agent.model, "deadline", None)):
+                return agent.run(prompt)
+        except StepDeadlineExceeded as e:
+            logger.warning(str(e))
+            return None
+
+    def run_structured(self, agent: Agent, prompt: str, schema: Any) -> Any:
+        """
+        Run a structured-output agent and coerce its response into ``schema``.
+        
+        Malformed output is repaired locally first. Fields or list items that still fail
+        validation are asked for once more, from a copy of the agent without tools, and
+        merged into the valid rest of the response instead of restarting the step.
+        
+        Args:
+            agent: Agent configured with a response model
+            prompt: Prompt for the agent
+            schema: Expected model class, or ``list[Model]``
+        
+        Returns:
+            The coerced output, or None if it could not be recovered
+        """
+        response = self.run_step(agent, prompt)
+        content = response.content if response else None
+        
+        # Nothing to correct after a missed deadline or an empty response
+        if content is None or (isinstance(content, str) and not content.strip()):
+            logger.error(f"{agent.name} returned no structured output")
+            return None
+        
+        if typing.get_origin(schema) is list:
+            return self.correct_items(agent, prompt, content, typing.get_args(schema)[0])
+        return self.correct_fields(agent, prompt, content, schema)
+
+    def correct_fields(self, agent: Agent, prompt: str, content: Any, schema: Type[BaseModel]) -> Optional[BaseModel]:
+        """Coerce a structured response, asking the agent again for the fields that fail."""
+        value, _ = coerce_model(content, schema)
+        if value is not None:
+            return value
+        
+        valid, errors = split_fields(content, schema)
+        logger.warning(f"{agent.name} returned invalid fields {', '.join(errors)}, asking for them again")
+        retry_response = self.run_step(
+            self.correction_agent(agent, partial_model(schema, list(errors))),
+            self.correction_prompt(prompt, content, "\n".join(errors.values()))
+            + f"Return only the fields {', '.join(errors)}, corrected. The other fields are kept.",
+        )
+        corrected, _ = split_fields(retry_response.content if retry_response else None, schema)
+        value, error = coerce_model({**valid, **{name: corrected[name] for name in errors if name in corrected}}, schema)
+        if value is None:
+            logger.error(f"{agent.name} structured output could not be recovered: {error}")
+        return value
+
+    def correct_items(self, agent: Agent, prompt: str, content: Any, item_schema: Type[BaseModel]) -> Optional[List[BaseModel]]:
+        """Coerce a list response, asking the agent again for the items that fail."""
+        values, errors = coerce_model_list(content, item_schema)
+        if not errors:
+            return values
+        
+        logger.warning(f"{agent.name} returned {len(errors)} invalid items, asking for them again")
+        retry_response = self.run_step(
+            self.correction_agent(agent, list_model(item_schema)),
+            self.correction_prompt(prompt, content, "\n".join(errors))
+            + f"Return only the rejected items, corrected. The {len(values)} valid items are kept.",
+        )
+        corrected, errors = coerce_model_list(retry_response.content if retry_response else None, item_schema)
+        values = values + corrected
+        if errors:
+            logger.warning(f"Dropping {len(errors)} {item_schema.__name__} items that could not be recovered")
+        if not values:
+            logger.error(f"{agent.name} structured output could not be recovered: {'; '.join(errors)}")
+            return None
+        return values
+
+    @staticmethod
+    def correction_prompt(prompt: str, content: Any, errors: str) -> str:
+        previous = content.model_dump_json() if isinstance(content, BaseModel) else str(content)
+        return (
+            f"{prompt}\n\n"
+            f"Your previous response to this request could not be validated.\n\n"
+            f"Validation errors:\n{errors}\n\n"
+            f"Previous response:\n{previous}\n\n"
+        )
+
+    @staticmethod
+    def correction_agent(agent: Agent, response_model: Type[BaseModel]) -> Agent:
+        """Copy of a step agent that answers with ``response_model`` and has no tools to call again."""
+        model = copy.copy(agent.model)
+        model.reset_tools_and_functions()
+        return Agent(
+            name=agent.name,
+            model=model,
+            description=agent.description,
+            instructions=["Correct your previous response using only the information it already contains"],
+            response_model=response_model,
+            structured_outputs=True,
+        )
+
     def get_cached_blog_post(self, user_input: str) -> Optional[str]:
         """Get a cached blog post if available."""
-        return self.session_state.get("blog_posts", {}).get(user_input)
+        return post_cache.get(user_input)
 
     def add_blog_post_to_cache(self, user_input: str, blog_post: str):
         """Cache a blog post for future reuse."""
         logger.info(f"Caching blog post for: {user_input}")
-        self.session_state.setdefault("blog_posts", {})
-        self.session_state["blog_posts"][user_input] = blog_post
+        post_cache.put(user_input, blog_post)
+
+
+# Local index of references gathered by earlier runs, shared by all workflow instances
+research_index = ResearchIndex(research_index_path, ttl_days=research_index_ttl_days)
 
+# Finished posts, shared by all users and sessions
+post_cache = PostCache(blog_post_cache_path)
 
-# Create an instance of the workflow
+# Create an instance of the workflow. The playground runs every request on a fresh copy of
+# it, which gets its own session: agno ignores a session_id sent with the run request.
+# Sessions are sharded over several SQLite files.
 blog_workflow = BlogPostGenerator(
-    session_id="blog-post-generator",
-    storage=SqliteStorage(
+    storage=ShardedSqliteStorage(
         table_name="blog_post_generator",
-        db_file=agent_storage
+        db_dir=session_dir,
+        shards=session_shards,
+        mode="workflow",
     )
 )
@@ -0,0 +1,58 @@
+"""
+Draft patching module.
+
+Applies anchored edits returned by an editor agent to a draft locally, so the editor
+does not have to re-emit the whole post.
+"""
+
+import re
+from typing import Any, Iterable, Tuple
+
+
+class PatchError(ValueError):
+    """Raised when an edit cannot be applied unambiguously to the draft."""
+
+
+def _locate(draft: str, anchor: str) -> Tuple[int, int]:
+    """Find the single span of ``anchor`` in ``draft``, tolerating whitespace differences."""
+    if not anchor.strip():
+        raise PatchError("Edit anchor is empty")
+
+    count = draft.count(anchor)
+    if count == 1:
+        start = draft.index(anchor)
+        return start, start + len(anchor)
+    if count > 1:
+        raise PatchError(f"Anchor appears {count} times: {anchor[:60]!r}")
+
+    # Models often reflow lines or collapse spaces when quoting the draft
+    pattern = r"\s+".join(re.escape(word) for word in anchor.split())
+    matches = list(re.finditer(pattern, draft))
+    if len(matches) != 1:
+        found = "not found" if not matches else f"appears {len(matches)} times"
+        raise PatchError(f"Anchor {found}: {anchor[:60]!r}")
+    return matches[0].span()
+
+
+def apply_edits(draft: str, edits: Iterable[Any]) -> str:
+    """Apply edits to a draft in order.
+
+    Edits are objects with ``operation``, ``anchor`` and ``text`` attributes, and each one
+    is resolved against the draft as modified by the previous edits. Supported operations
+    are ``replace`` (anchor becomes text), ``insert_after`` (text is inserted after the
+    anchor) and ``delete`` (anchor is removed).
+
+    Raises:
+        PatchError: If an anchor is missing or ambiguous, or the operation is unknown
+    """
+    for edit in edits:
+        start, end = _locate(draft, edit.anchor)
+        if edit.operation == "replace":
+            draft = draft[:start] + edit.text + draft[end:]
+        elif edit.operation == "insert_after":
+            draft = draft[:end] + edit.text + draft[end:]
+        elif edit.operation == "delete":
+            draft = draft[:start] + draft[end:]
+        else:
+            raise PatchError(f"Unknown edit operation: {edit.operation!r}")
+    return draft
@@ -0,0 +1,256 @@
+"""
+Structured output repair module.
+
+Fixes near-valid JSON emitted by structured-output agents and coerces it into the
+expected pydantic models, so a slightly malformed response does not abort a workflow.
+"""
+
+import json
+import re
+import typing
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel, Field, ValidationError, create_model
+
+_FENCE = re.compile(r"^\s*```[a-zA-Z]*\s*|\s*```\s*$")
+_TRAILING_COMMA = re.compile(r",\s*([\]}])")
+_PY_LITERALS = {"True": "true", "False": "false", "None": "null"}
+
+
+def _extract_json_region(text: str) -> str:
+    """Drop markdown fences and any prose before the first JSON value."""
+    text = _FENCE.sub("", text.strip())
+    starts = [i for i in (text.find("{"), text.find("[")) if i != -1]
+    return text[min(starts):] if starts else text
+
+
+def _decode_first(text: str) -> Any:
+    """Parse the JSON value at the start of ``text``, ignoring anything after it."""
+    return json.JSONDecoder().raw_decode(text)[0]
+
+
+def _close_truncated(text: str) -> str:
+    """Close strings, arrays and objects left open by a truncated response."""
+    stack: List[str] = []
+    in_string = False
+    escaped = False
+    for char in text:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "{[":
+            stack.append("}" if char == "{" else "]")
+        elif char in "}]" and stack:
+            stack.pop()
+
+    if in_string:
+        text += '"'
+    text = text.rstrip()
+    # A dangling key or separator cannot be completed, so drop it before closing
+    if stack and stack[-1] == "}":
+        text = re.sub(r'([{,])\s*"(?:\\.|[^"\\])*"\s*:?\s*$', r"\1", text)
+    text = re.sub(r"[,:]\s*$", "", text)
+    return text + "".join(reversed(stack))
+
+
+def _replace_python_literals(text: str) -> str:
+    """Turn bare Python literals outside strings into their JSON spelling."""
+    out = []
+    for i, part in enumerate(re.split(r'("(?:\\.|[^"\\])*")', text)):
+        if i % 2 == 0:
+            part = re.sub(r"\b(True|False|None)\b", lambda m: _PY_LITERALS[m.group(1)], part)
+        out.append(part)
+    return "".join(out)
+
+
+def repair_json(text: str) -> Any:
+    """Parse JSON, repairing common defects of model output along the way.
+
+    Handles markdown fences, surrounding prose, trailing commas, Python literals and
+    responses truncated in the middle of an array or object.
+
+    Raises:
+        ValueError: If the text cannot be repaired into valid JSON
+    """
+    try:
+        return json.loads(text)
+    except (TypeError, ValueError):
+        pass
+
+    candidate = _replace_python_literals(_extract_json_region(text))
+    candidate = _TRAILING_COMMA.sub(r"\1", candidate)
+    try:
+        return _decode_first(candidate)
+    except ValueError:
+        pass
+
+    candidate = _TRAILING_COMMA.sub(r"\1", _close_truncated(candidate))
+    try:
+        return _decode_first(candidate)
+    except ValueError as e:
+        raise ValueError(f"Could not repair JSON: {e}") from e
+
+
+def _normalize_key(key: str) -> str:
+    return re.sub(r"[^a-z0-9]", "", key.lower())
+
+
+def _model_type(annotation: Any) -> Optional[Type[BaseModel]]:
+    """The pydantic model inside ``Model``, ``Optional[Model]`` or ``list[Model]``, if any."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    for arg in typing.get_args(annotation):
+        found = _model_type(arg)
+        if found is not None:
+            return found
+    return None
+
+
+def normalize_keys(data: Any, model: Type[BaseModel]) -> Any:
+    """Map differently cased or punctuated keys onto the model's field names, recursively."""
+    if isinstance(data, list):
+        return [normalize_keys(item, model) for item in data]
+    if not isinstance(data, dict):
+        return data
+
+    fields = {_normalize_key(name): name for name in model.model_fields}
+    normalized = {}
+    for key, value in data.items():
+        name = fields.get(_normalize_key(str(key)), key)
+        field = model.model_fields.get(name)
+        nested = _model_type(field.annotation) if field is not None else None
+        normalized[name] = normalize_keys(value, nested) if nested is not None else value
+    return normalized
+
+
+def _unwrap(content: Any, model: Type[BaseModel]) -> Any:
+    """Drop a single key named after the model wrapped around the object, if present."""
+    if isinstance(content, dict) and len(content) == 1 and _normalize_key(next(iter(content))) == _normalize_key(model.__name__):
+        return next(iter(content.values()))
+    return content
+
+
+def coerce_model(content: Any, model: Type[BaseModel]) -> Tuple[Optional[BaseModel], Optional[str]]:
+    """Coerce agent output into a model instance.
+
+    Args:
+        content: Parsed model, dict, or raw JSON string returned by the agent
+        model: Expected pydantic model
+
+    Returns:
+        A ``(value, error)`` tuple, where exactly one of the two is set
+    """
+    if isinstance(content, model):
+        return content, None
+    if isinstance(content, BaseModel):
+        content = content.model_dump()
+    try:
+        if isinstance(content, str):
+            content = repair_json(content)
+        return model.model_validate(normalize_keys(_unwrap(content, model), model)), None
+    except (ValueError, ValidationError) as e:
+        return None, str(e)
+
+
+def coerce_model_list(content: Any, model: Type[BaseModel]) -> Tuple[List[BaseModel], List[str]]:
+    """Coerce agent output into a list of model instances, keeping the valid items.
+
+    Accepts a list, a single object, or an object wrapping the list under one key.
+
+    Returns:
+        A ``(values, errors)`` tuple with one error message per rejected item
+    """
+    if isinstance(content, BaseModel) and not isinstance(content, model):
+        content = content.model_dump()
+    if isinstance(content, str):
+        try:
+            content = repair_json(content)
+        except ValueError as e:
+            return [], [str(e)]
+    if isinstance(content, dict):
+        lists = [value for value in content.values() if isinstance(value, list)]
+        content = lists[0] if len(lists) == 1 else [content]
+    if not isinstance(content, list):
+        return [], [f"Expected a list of {model.__name__}, got {type(content).__name__}"]
+
+    values: List[BaseModel] = []
+    errors: List[str] = []
+    for index, item in enumerate(content):
+        value, error = coerce_model(item, model)
+        if value is not None:
+            values.append(value)
+        else:
+            errors.append(f"item {index}: {error}")
+    return values, errors
+
+
+def coerce_structured(content: Any, schema: Union[Type[BaseModel], Any]) -> Tuple[Any, Optional[str]]:
+    """Coerce agent output into ``Model`` or ``list[Model]``.
+
+    Lists are accepted when at least one item is valid; invalid items are dropped.
+
+    Returns:
+        A ``(value, error)`` tuple, where ``value`` is None when coercion failed
+    """
+    if typing.get_origin(schema) is list:
+        item_model = typing.get_args(schema)[0]
+        values, errors = coerce_model_list(content, item_model)
+        if values:
+            return values, None
+        return None, "; ".join(errors) or f"No valid {item_model.__name__} items"
+    return coerce_model(content, schema)
+
+
+def split_fields(content: Any, model: Type[BaseModel]) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """Split agent output into the fields that validate and the errors of those that do not.
+
+    Every field fails when the output is not an object, or when an error cannot be pinned
+    on a single field.
+
+    Returns:
+        A ``(valid, errors)`` tuple of field values and error messages, keyed by field name
+    """
+    if isinstance(content, BaseModel):
+        content = content.model_dump()
+    try:
+        data = _unwrap(repair_json(content) if isinstance(content, str) else content, model)
+    except ValueError as e:
+        return {}, {name: str(e) for name in model.model_fields}
+    if not isinstance(data, dict):
+        return {}, {name: f"Expected an object, got {type(data).__name__}" for name in model.model_fields}
+
+    data = normalize_keys(data, model)
+    errors: Dict[str, str] = {}
+    try:
+        model.model_validate(data)
+    except ValidationError as e:
+        for error in e.errors():
+            name = error["loc"][0] if error["loc"] else None
+            if name not in model.model_fields:
+                return {}, {field: error["msg"] for field in model.model_fields}
+            location = ".".join(str(part) for part in error["loc"])
+            errors[name] = "; ".join(filter(None, [errors.get(name), f"{location}: {error['msg']}"]))
+    valid = {name: value for name, value in data.items() if name in model.model_fields and name not in errors}
+    return valid, errors
+
+
+def partial_model(model: Type[BaseModel], names: List[str]) -> Type[BaseModel]:
+    """Model with only the named fields of ``model``, to ask for just those fields again.
+
+    Validators are not carried over, merge the answer and validate it against ``model``.
+    """
+    return create_model(model.__name__, **{name: (model.model_fields[name].annotation, model.model_fields[name]) for name in names})
+
+
+def list_model(model: Type[BaseModel]) -> Type[BaseModel]:
+    """Model wrapping a list of ``model`` items, to ask for several items at once."""
+    return create_model(
+        f"{model.__name__}List",
+        items=(List[model], Field(..., description=f"The requested {model.__name__} items.")),
+    )
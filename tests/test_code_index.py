@@ -0,0 +1,108 @@
+"""
+Code index tests.
+
+Checks substring search, symbol ranking, the confinement of reads to the indexed tree,
+and that file and directory changes reach the index, directly and through the watcher.
+"""
+
+import shutil
+import time
+from pathlib import Path
+
+import pytest
+
+from agno_playground.knowledge import CodeIndex
+
+
+def write(root: Path, relative: str, text: str) -> Path:
+    path = root / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+def wait_for(condition, timeout: float = 15.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.1)
+    return condition()
+
+
+@pytest.fixture
+def tree(tmp_path) -> Path:
+    write(tmp_path, "pkg/a.py", 'class ShardRouter:\n    """Routes sessions."""\n\n    def route(self, session_id):\n        return hash(session_id)\n')
+    write(tmp_path, "pkg/b.py", "def shard_for(key):\n    return 0\n\n\nSHARD_COUNT = 8\n")
+    write(tmp_path, "docs/notes.md", "Sessions are Routed by a hash of their id.\n")
+    write(tmp_path, "pkg/__pycache__/a.cpython-311.py", "def shard_for(key): pass\n")
+    return tmp_path
+
+
+def index_of(root: Path) -> CodeIndex:
+    index = CodeIndex(str(root), watch=False)
+    index.refresh()
+    return index
+
+
+def test_search_finds_substrings_case_insensitively(tree):
+    index = index_of(tree)
+
+    matches = index.search("routed BY")
+    assert [(m.path, m.line) for m in matches] == [("docs/notes.md", 1)]
+    assert [(m.path, m.line) for m in index.search("session_id")] == [("pkg/a.py", 4), ("pkg/a.py", 5)]
+    assert [m.path for m in index.search("session", path_prefix="docs/")] == ["docs/notes.md"]
+    assert index.search("not anywhere in the tree") == []
+
+
+def test_find_symbols_ranks_exact_then_prefix_then_substring(tree):
+    write(tree, "pkg/c.py", "def shard(): pass\ndef reshard(): pass\n")
+    index = index_of(tree)
+
+    # Ties within a rank are ordered by path and line
+    assert [s.name for s in index.find_symbols("shard")] == ["shard", "ShardRouter", "shard_for", "SHARD_COUNT", "reshard"]
+    assert [s.qualname for s in index.find_symbols("ShardRouter.route")] == ["ShardRouter.route"]
+    assert [s.name for s in index.find_symbols("shard", kind="class")] == ["ShardRouter"]
+
+
+def test_read_is_confined_to_indexed_files(tree):
+    write(tree.parent, "secret.py", "TOKEN = 'secret'\n")
+    index = index_of(tree)
+
+    assert index.read("pkg/b.py", 1, 1) == "    1  def shard_for(key):"
+    assert index.read("../secret.py") is None
+    assert index.read(str(tree.parent / "secret.py")) is None
+    assert index.read("pkg/__pycache__/a.cpython-311.py") is None
+
+
+def test_directory_moves_and_deletions_update_the_index(tree):
+    index = index_of(tree)
+
+    (tree / "pkg").rename(tree / "pkg2")
+    index.update([str(tree / "pkg"), str(tree / "pkg2")])
+    assert {s.path for s in index.find_symbols("shard_for")} == {"pkg2/b.py"}
+
+    write(tree, "new/deeper/c.py", "def fresh(): pass\n")
+    index.update([str(tree / "new")])
+    assert [s.path for s in index.find_symbols("fresh")] == ["new/deeper/c.py"]
+
+    shutil.rmtree(tree / "pkg2")
+    index.update([str(tree / "pkg2")])
+    assert index.find_symbols("shard_for") == []
+    assert index.search("session_id") == []
+
+
+def test_watcher_applies_edits_and_deletions(tree):
+    index = CodeIndex(str(tree), watch=True)
+    try:
+        assert index.ensure_ready(10)
+
+        write(tree, "pkg/b.py", "def shard_for(key):\n    return rendezvous(key)\n")
+        write(tree, "added/c.py", "def added_later(): pass\n")
+        assert wait_for(lambda: index.search("rendezvous") and index.find_symbols("added_later"))
+
+        (tree / "pkg/a.py").unlink()
+        shutil.rmtree(tree / "added")
+        assert wait_for(lambda: not index.find_symbols("ShardRouter") and not index.find_symbols("added_later"))
+    finally:
+        index.stop()
@@ -0,0 +1,48 @@
+"""
+Editor benchmark tests.
+
+Checks that the reported savings match what the workflow pays in patch mode.
+"""
+
+import json
+
+import pytest
+from agno.agent import RunResponse
+
+from agno_playground.benchmarks.editor import benchmark_draft
+
+DRAFT = "Teh quick brown fox jumps over the lazy dog."
+
+
+class StubWorkflow:
+    """Answers the patch editor with fixed edits and the editor with a rewrite."""
+
+    patch_editor = "patch_editor"
+    editor = "editor"
+
+    def __init__(self, anchor: str):
+        self.anchor = anchor
+
+    def run_step(self, agent, prompt):
+        if agent == self.patch_editor:
+            edits = {"edits": [{"operation": "replace", "anchor": self.anchor, "text": "The"}]}
+            return RunResponse(content=json.dumps(edits), metrics={"output_tokens": [10]})
+        return RunResponse(content=DRAFT.replace("Teh", "The"), metrics={"output_tokens": [40]})
+
+
+def test_applied_patch_saves_the_rewrite_minus_the_patch():
+    post = benchmark_draft(StubWorkflow(anchor="Teh"), DRAFT)
+
+    assert post["patch"]["applied"]
+    assert post["patch_mode"]["output_tokens"] == 10
+    assert post["output_tokens_saved"] == 30
+    assert post["latency_saved_s"] == pytest.approx(post["rewrite"]["latency_s"] - post["patch"]["latency_s"])
+
+
+def test_failed_patch_costs_the_patch_on_top_of_the_rewrite():
+    post = benchmark_draft(StubWorkflow(anchor="missing"), DRAFT)
+
+    assert not post["patch"]["applied"]
+    assert post["patch_mode"]["output_tokens"] == 50
+    assert post["output_tokens_saved"] == -10
+    assert post["latency_saved_s"] == pytest.approx(-post["patch"]["latency_s"])
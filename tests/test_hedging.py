@@ -0,0 +1,262 @@
+"""
+Hedged model tests.
+
+Checks that deadlines bound the underlying requests, that a workflow step's budget is
+shared by all the model calls it makes, and that slow requests are hedged and cancelled.
+"""
+
+import asyncio
+import json
+import threading
+import time
+import uuid
+
+import httpx
+import pytest
+from agno.models.message import Message
+from openai import AsyncOpenAI
+
+from agno_playground.benchmarks.fake_model import FAKE_BASE_URL, FakeOpenAIBackend
+from agno_playground.models import HedgedOpenAIChat, StepDeadlineExceeded, hedge_registry, step_deadline
+
+
+class RecordingBackend(FakeOpenAIBackend):
+    """Fake backend that records the timeout and thread of every request."""
+
+    def __init__(self, **kwargs):
+        super().__init__(latency=0.0, token_latency=0.0, output_tokens=4, **kwargs)
+        self.timeouts = []
+        self.threads = []
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        timeout = request.extensions["timeout"]["read"]
+        self.timeouts.append(timeout)
+        self.threads.append(threading.get_ident())
+        # The mock transport does not enforce timeouts, behave like a real one would
+        if timeout is not None and self.latency > timeout:
+            time.sleep(timeout)
+            raise httpx.ReadTimeout("Read timed out", request=request)
+        return super().handle(request)
+
+
+class TrackedStream(httpx.SyncByteStream):
+    """Response body that streams slowly for the primary model and records early closes."""
+
+    def __init__(self, backend: "RacingBackend", model: str, chunks):
+        self.backend = backend
+        self.model = model
+        self.chunks = chunks
+        self.finished = False
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            time.sleep(0.02 if self.model == "gpt-4o" else 0.0)
+            self.backend.sent[self.model] += 1
+            yield chunk
+        self.finished = True
+
+    def close(self):
+        if not self.finished:
+            self.backend.closed_early.append(self.model)
+
+
+class RacingBackend(FakeOpenAIBackend):
+    """Fake backend streaming slowly for the primary model and quickly for the hedge model.
+
+    Counts the chunks sent per model and whether each response was closed before its end.
+    """
+
+    def __init__(self, failures: int = 0):
+        super().__init__(latency=0.0, token_latency=0.0, output_tokens=50)
+        self.failures = failures
+        self.requests = []
+        self.sent = {"gpt-4o": 0, "gpt-4o-mini": 0}
+        self.closed_early = []
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        model = json.loads(request.content)["model"]
+        self.requests.append(model)
+        if self.failures:
+            self.failures -= 1
+            return httpx.Response(503, json={"error": {"message": "overloaded"}})
+        response = super().handle(request)
+        return httpx.Response(200, headers=response.headers, stream=TrackedStream(self, model, response.stream))
+
+    async def ahandle(self, request: httpx.Request) -> httpx.Response:
+        model = json.loads(await request.aread())["model"]
+        self.requests.append(model)
+        await asyncio.sleep(1.0 if model == "gpt-4o" else 0.0)
+        return await super().ahandle(request)
+
+
+def model_for(backend: FakeOpenAIBackend, deadline: float, **kwargs) -> HedgedOpenAIChat:
+    return HedgedOpenAIChat(
+        id="gpt-4o",
+        step=f"test.{uuid.uuid4().hex}",
+        deadline=deadline,
+        api_key="test",
+        base_url=FAKE_BASE_URL,
+        http_client=httpx.Client(transport=httpx.MockTransport(backend.handle)),
+        **kwargs,
+    )
+
+
+def prime(name: str, latency: float, samples: int = 20) -> None:
+    """Record enough latencies for a step to start hedging after ``latency`` seconds."""
+    for _ in range(samples):
+        hedge_registry.record(name, latency)
+
+
+def invoke(model: HedgedOpenAIChat):
+    return model.invoke([Message(role="user", content="hello")])
+
+
+def test_call_without_hedge_delay_runs_on_caller_thread_with_deadline_timeout():
+    backend = RecordingBackend()
+    model = model_for(backend, deadline=30)
+
+    invoke(model)
+
+    assert backend.threads == [threading.get_ident()]
+    assert 29 < backend.timeouts[0] <= 30
+
+
+def test_step_budget_is_shared_by_the_calls_of_a_step():
+    backend = RecordingBackend()
+    model = model_for(backend, deadline=30)
+
+    with step_deadline(0.5):
+        invoke(model)
+        time.sleep(0.2)
+        invoke(model)
+        assert backend.timeouts[1] < 0.31
+        time.sleep(0.31)
+        with pytest.raises(StepDeadlineExceeded):
+            invoke(model)
+
+    assert len(backend.timeouts) == 2
+    assert hedge_registry.snapshot()[model.step]["timeouts"] == 1
+
+
+def test_request_outliving_the_deadline_is_abandoned():
+    backend = RecordingBackend()
+    backend.latency = 1.0
+    model = model_for(backend, deadline=30)
+
+    started = time.perf_counter()
+    with step_deadline(0.2), pytest.raises(StepDeadlineExceeded):
+        invoke(model)
+
+    assert time.perf_counter() - started < 0.9
+    assert backend.timeouts[0] <= 0.2
+
+
+def test_deadline_error_reports_the_enforced_step_budget():
+    backend = RecordingBackend()
+    model = model_for(backend, deadline=None)
+
+    with step_deadline(0.1):
+        time.sleep(0.15)
+        with pytest.raises(StepDeadlineExceeded, match="0.1s deadline"):
+            invoke(model)
+
+
+def test_transient_errors_are_retried_within_the_budget():
+    backend = RacingBackend(failures=1)
+    model = model_for(backend, deadline=30, hedging=False)
+
+    response = invoke(model)
+
+    assert response.choices[0].message.content.startswith("token0")
+    assert backend.requests == ["gpt-4o", "gpt-4o"]
+    assert hedge_registry.snapshot()[model.step]["retries"] == 1
+
+
+def test_timeouts_are_not_retried():
+    backend = RecordingBackend()
+    backend.latency = 1.0
+    model = model_for(backend, deadline=0.2)
+
+    with pytest.raises(StepDeadlineExceeded):
+        invoke(model)
+
+    assert len(backend.timeouts) == 1
+
+
+def test_slow_request_is_hedged_and_the_loser_closed():
+    backend = RacingBackend()
+    model = model_for(backend, deadline=30, hedge_model_id="gpt-4o-mini")
+    prime(model.step, 0.05)
+
+    started = time.perf_counter()
+    response = invoke(model)
+    elapsed = time.perf_counter() - started
+
+    assert response.model == "gpt-4o-mini"
+    assert elapsed < 0.5
+    stats = hedge_registry.snapshot()[model.step]
+    assert (stats["calls"], stats["hedged"], stats["hedge_wins"]) == (1, 1, 1)
+
+    # The primary stops at its next chunk instead of streaming all of its tokens
+    time.sleep(0.1)
+    assert backend.closed_early == ["gpt-4o"]
+    assert backend.sent["gpt-4o"] < 20
+    assert hedge_registry.snapshot()[model.step]["cancelled"] == 1
+
+
+def test_fast_request_is_not_hedged():
+    backend = RacingBackend()
+    model = model_for(backend, deadline=30, hedge_model_id="gpt-4o-mini")
+    prime(model.step, 5.0)
+
+    invoke(model)
+
+    assert backend.requests == ["gpt-4o"]
+    assert hedge_registry.snapshot()[model.step]["hedged"] == 0
+
+
+def test_stream_is_hedged_until_the_first_chunk_and_bounded_by_the_deadline():
+    backend = RacingBackend()
+    model = model_for(backend, deadline=0.3, hedge_model_id="gpt-4o-mini")
+    prime(f"{model.step}.stream", 0.01)
+
+    chunks = model.invoke_stream([Message(role="user", content="hello")])
+    content = "".join(chunk.choices[0].delta.content or "" for chunk in chunks if chunk.choices)
+    assert content.startswith("token0")
+    stats = hedge_registry.snapshot()[f"{model.step}.stream"]
+    assert (stats["hedged"], stats["hedge_wins"]) == (1, 1)
+
+    slow = model_for(backend, deadline=0.3)
+    started = time.perf_counter()
+    with pytest.raises(StepDeadlineExceeded):
+        for _ in slow.invoke_stream([Message(role="user", content="hello")]):
+            pass
+    assert time.perf_counter() - started < 0.5
+    assert "gpt-4o" in backend.closed_early
+
+
+def test_async_loser_is_cancelled():
+    backend = RacingBackend()
+    model = model_for(
+        backend,
+        deadline=30,
+        hedge_model_id="gpt-4o-mini",
+        async_client=AsyncOpenAI(
+            api_key="test",
+            base_url=FAKE_BASE_URL,
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(backend.ahandle)),
+        ),
+    )
+    prime(model.step, 0.05)
+
+    async def run():
+        response = await model.ainvoke([Message(role="user", content="hello")])
+        await asyncio.sleep(0)
+        return response
+
+    started = time.perf_counter()
+    response = asyncio.run(run())
+
+    assert response.model == "gpt-4o-mini"
+    assert time.perf_counter() - started < 0.5
+    assert hedge_registry.snapshot()[model.step]["cancelled"] == 1
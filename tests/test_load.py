@@ -0,0 +1,40 @@
+"""
+Load harness tests.
+
+Checks that time-to-first-token is taken from parsed run events rather than from the
+first bytes of the stream.
+"""
+
+import json
+
+from agno_playground.benchmarks.load import EventStreamParser, is_first_token
+
+
+def stream(*events) -> str:
+    return "".join(json.dumps(event, indent=2) for event in events)
+
+
+def test_parser_splits_events_across_chunks():
+    body = stream({"event": "RunStarted"}, {"event": "RunResponse", "content": "Hel{lo"})
+    parser = EventStreamParser()
+
+    events = []
+    for i in range(0, len(body), 7):
+        events.extend(parser.feed(body[i:i + 7]))
+
+    assert [event["event"] for event in events] == ["RunStarted", "RunResponse"]
+    assert events[1]["content"] == "Hel{lo"
+
+
+def test_agent_first_token_skips_run_and_tool_events():
+    assert not is_first_token("agents", {"event": "RunStarted", "content": "Run started"})
+    assert not is_first_token("agents", {"event": "ToolCallStarted", "content": "search()"})
+    assert not is_first_token("agents", {"event": "RunResponse", "content": ""})
+    assert is_first_token("agents", {"event": "RunResponse", "content": "Hello"})
+    assert is_first_token("teams", {"event": "RunResponse", "content": "Hello"})
+
+
+def test_workflow_first_token_skips_progress_updates():
+    assert not is_first_token("workflows", {"event": "RunResponse", "content": "Step 1/6: Researching blog topic..."})
+    assert is_first_token("workflows", {"event": "RunResponse", "content": "Draft paragraph"})
+    assert is_first_token("workflows", {"event": "WorkflowCompleted", "content": "# Final post"})
@@ -0,0 +1,79 @@
+"""
+Request profiling tests.
+
+Runs the blog workflow behind the profiling middleware on the fake model and checks that
+the work done in Starlette's threadpool shows up in the saved profile, while the work of
+other concurrent requests does not.
+"""
+
+import threading
+import time
+import uuid
+
+import pytest
+from agno.playground import Playground
+from fastapi.testclient import TestClient
+
+from agno_playground.benchmarks import FakeOpenAIBackend, install_fake_model
+from agno_playground.profiling import ProfileStore, ProfilingMiddleware
+from agno_playground.workflows import blog_workflow
+
+
+@pytest.fixture
+def store(tmp_path) -> ProfileStore:
+    return ProfileStore(str(tmp_path / "profiles"))
+
+
+@pytest.fixture
+def client(store) -> TestClient:
+    install_fake_model(workflows=[blog_workflow], backend=FakeOpenAIBackend(latency=0.01, token_latency=0.0005))
+    app = Playground(workflows=[blog_workflow]).get_app()
+
+    @app.get("/busy")
+    def busy_for_another_request():
+        deadline = time.perf_counter() + 1.0
+        while time.perf_counter() < deadline:
+            pass
+        return {}
+
+    app.add_middleware(ProfilingMiddleware, store=store, interval=0.001)
+    return TestClient(app)
+
+
+def run_workflow(client: TestClient):
+    return client.post(
+        f"/v1/playground/workflows/{blog_workflow.workflow_id}/runs",
+        json={"input": {"user_input": f"profiling {uuid.uuid4().hex}", "use_cached_result": False}},
+        headers={"X-Profile": "1"},
+    )
+
+
+def test_profiled_workflow_request_includes_worker_threads(client, store):
+    response = run_workflow(client)
+    assert response.status_code == 200
+
+    profiles = store.list()
+    assert len(profiles) == 1
+    assert profiles[0]["samples"] > 0
+    summary = store.summary(profiles[0]["profile_id"], limit=None)
+    assert "blog.py" in summary
+    assert "(run)" in summary
+
+
+def test_unprofiled_request_saves_nothing(client, store):
+    response = client.get("/v1/playground/status")
+    assert response.status_code == 200
+    assert store.list() == []
+
+
+def test_profile_leaves_out_concurrent_requests(client, store):
+    other = threading.Thread(target=client.get, args=("/busy",))
+    other.start()
+    time.sleep(0.1)
+    response = run_workflow(client)
+    other.join()
+    assert response.status_code == 200
+
+    summary = store.summary(store.list()[0]["profile_id"], limit=None)
+    assert "blog.py" in summary
+    assert "busy_for_another_request" not in summary
@@ -0,0 +1,96 @@
+"""
+Model client provider tests.
+
+Checks that pooled models with the same client params share one OpenAI client and one
+connection pool, that explicitly set clients take precedence, and that connection reuse
+is counted.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+from openai import OpenAI
+
+from agno_playground.benchmarks.fake_model import FakeOpenAIBackend
+from agno_playground.models import PooledOpenAIChat, provider
+from agno_playground.models.provider import ModelClientProvider, PoolConfig
+
+
+@pytest.fixture
+def pool(monkeypatch) -> ModelClientProvider:
+    pool = ModelClientProvider(PoolConfig(http2=False))
+    monkeypatch.setattr(provider, "client_provider", pool)
+    return pool
+
+
+@pytest.fixture
+def server():
+    """Local keep-alive HTTP server answering chat completions like the fake backend."""
+    backend = FakeOpenAIBackend(latency=0.0, token_latency=0.0, output_tokens=4)
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            payload = json.dumps(backend._completion(body, backend._content_for(body))).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{httpd.server_address[1]}/v1"
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_models_with_equal_params_share_client_and_pool(pool):
+    first = PooledOpenAIChat(id="gpt-4o", api_key="test")
+    second = PooledOpenAIChat(id="gpt-4o-mini", api_key="test")
+    other_key = PooledOpenAIChat(id="gpt-4o", api_key="other")
+
+    assert first.get_client() is second.get_client()
+    assert first.get_async_client() is second.get_async_client()
+    assert other_key.get_client() is not first.get_client()
+
+    # Every OpenAI client sends its requests through the same pool
+    assert first.get_client()._client is pool._http_client
+    assert other_key.get_client()._client is pool._http_client
+    assert first.get_async_client()._client is pool._async_http_client
+
+
+def test_explicit_clients_take_precedence(pool):
+    client = OpenAI(api_key="test")
+    assert PooledOpenAIChat(id="gpt-4o", client=client).get_client() is client
+
+    http_client = httpx.Client()
+    model = PooledOpenAIChat(id="gpt-4o", api_key="test", http_client=http_client)
+    assert model.get_client()._client is http_client
+    assert model.get_client() is not PooledOpenAIChat(id="gpt-4o", api_key="test").get_client()
+    assert pool._clients.keys() == {pool._key({"api_key": "test"})}
+
+
+def test_metrics_count_connection_reuse(pool, server):
+    client = pool.get_client({"api_key": "test", "base_url": server})
+
+    for _ in range(3):
+        client.chat.completions.create(model="gpt-4o", messages=[{"role": "user", "content": "hi"}])
+
+    snapshot = pool.snapshot()
+    assert snapshot["requests"] == 3
+    assert snapshot["connections_opened"] == 1
+    assert snapshot["tls_handshakes"] == 0
+    assert snapshot["connection_reuse_ratio"] == pytest.approx(2 / 3)
+    assert snapshot["connect_seconds_total"] > 0
@@ -0,0 +1,47 @@
+"""
+Research index tests.
+
+Checks that processes sharing an index file keep each other's references and that
+expired references are dropped.
+"""
+
+import sqlite3
+import time
+
+from agno_playground.knowledge import ResearchIndex
+
+
+def reference(title: str, *key_points: str) -> dict:
+    return {"title": title, "url": f"https://example.com/{title.lower().replace(' ', '-')}", "key_points": list(key_points)}
+
+
+def test_writers_sharing_a_file_keep_each_others_references(tmp_path):
+    path = str(tmp_path / "research.db")
+    first, second = ResearchIndex(path), ResearchIndex(path)
+
+    first.add([reference("Solar panel efficiency", "Panels convert 22% of sunlight")], topic="solar")
+    second.add([reference("Wind turbine output", "Offshore turbines reach 15 MW")], topic="wind")
+    second.add([reference("Solar panel efficiency", "Perovskite cells pass 30%")], topic="solar")
+
+    assert len(ResearchIndex(path)) == 2
+    hits = first.search("solar panel efficiency")
+    assert hits[0][0].key_points == ["Panels convert 22% of sunlight", "Perovskite cells pass 30%"]
+    assert first.search("offshore wind turbine")[0][0].title == "Wind turbine output"
+
+
+def test_expired_references_are_dropped_on_load_and_on_write(tmp_path):
+    path = tmp_path / "research.db"
+    index = ResearchIndex(str(path), ttl_days=1)
+    index.add([reference("Old battery chemistry", "Lead acid dominated"), reference("Grid storage", "Pumped hydro")])
+    with sqlite3.connect(path) as connection:
+        connection.execute("UPDATE refs SET added_at = ? WHERE title = 'Old battery chemistry'", (time.time() - 2 * 86400,))
+
+    assert len(ResearchIndex(str(path), ttl_days=1)) == 1
+
+    with sqlite3.connect(path) as connection:
+        connection.execute("UPDATE refs SET added_at = ? WHERE title = 'Grid storage'", (time.time() - 2 * 86400,))
+    index.add([reference("Sodium batteries", "Cheaper cathodes")])
+
+    assert len(index) == 1
+    with sqlite3.connect(path) as connection:
+        assert connection.execute("SELECT title FROM refs").fetchall() == [("Sodium batteries",)]
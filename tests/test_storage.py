@@ -0,0 +1,54 @@
+"""
+Session storage tests.
+"""
+
+import sqlite3
+from itertools import count
+
+from agno.storage.session.workflow import WorkflowSession
+
+from agno_playground.storage import PostCache, ShardedSqliteStorage
+from agno_playground.workflows import blog
+from agno_playground.workflows.blog import BlogPostGenerator
+
+
+def test_setting_unchanged_mode_does_not_rebuild_shard_tables(tmp_path, monkeypatch):
+    storage = ShardedSqliteStorage(table_name="sessions", db_dir=str(tmp_path), shards=4, mode="workflow")
+    rebuilt = []
+    for shard in storage.shards:
+        monkeypatch.setattr(shard, "get_table", lambda shard=shard: rebuilt.append(shard))
+
+    storage.mode = "workflow"
+    assert rebuilt == []
+
+    storage.mode = "agent"
+    assert len(rebuilt) == 4
+    assert {shard.mode for shard in storage.shards} == {"agent"}
+
+
+def test_sessions_are_stored_in_their_hashed_shard(tmp_path):
+    storage = ShardedSqliteStorage(table_name="sessions", db_dir=str(tmp_path), shards=4, mode="workflow")
+    first = "session-0"
+    second = next(f"session-{i}" for i in count(1) if storage.shard_for(f"session-{i}") is not storage.shard_for(first))
+
+    storage.upsert(WorkflowSession(session_id=first, user_id="alice", workflow_id="blog"))
+    storage.upsert(WorkflowSession(session_id=second, user_id="bob", workflow_id="blog"))
+
+    for index, shard in enumerate(storage.shards):
+        with sqlite3.connect(tmp_path / f"shard-{index:02d}.db") as connection:
+            stored = {row[0] for row in connection.execute("SELECT session_id FROM sessions")}
+        assert stored == {session_id for session_id in (first, second) if storage.shard_for(session_id) is shard}
+    assert storage.read(second).user_id == "bob"
+    assert sorted(storage.get_all_session_ids()) == sorted([first, second])
+
+
+def test_cached_posts_are_shared_across_sessions_and_users(tmp_path, monkeypatch):
+    monkeypatch.setattr(blog, "post_cache", PostCache(str(tmp_path / "posts.db")))
+    first = BlogPostGenerator(session_id="session-a", user_id="alice")
+    second = BlogPostGenerator(session_id="session-b", user_id="bob")
+
+    first.add_blog_post_to_cache("Sharding  SQLite sessions", "# Sharding SQLite")
+
+    # A hit finishes the run without calling any model
+    responses = list(second.run(user_input="sharding sqlite Sessions", use_cached_result=True))
+    assert [response.content for response in responses] == ["# Sharding SQLite"]
@@ -0,0 +1,123 @@
+"""
+Structured output tests.
+
+Feeds malformed completions through the blog workflow's structured-output agents and checks
+that they are repaired locally, or that only the failing parts are asked for again, instead
+of failing the step.
+"""
+
+import uuid
+from typing import Dict, List
+
+import httpx
+import pytest
+from openai import OpenAI
+
+from agno_playground.benchmarks.fake_model import FAKE_BASE_URL, FakeOpenAIBackend
+from agno_playground.workflows.blog import BlogPostGenerator, BlogReference, BlogTopic
+from agno_playground.workflows.repair import repair_json
+
+
+class ScriptedBackend(FakeOpenAIBackend):
+    """Chat completions endpoint answering each request with the next scripted content."""
+
+    def __init__(self, *contents: str):
+        super().__init__(latency=0.0, token_latency=0.0)
+        self.contents = list(contents)
+        self.requests: List[Dict] = []
+
+    def _content_for(self, body: Dict) -> str:
+        self.requests.append(body)
+        return self.contents.pop(0)
+
+    def user_prompts(self) -> List[str]:
+        return [
+            message["content"]
+            for body in self.requests
+            for message in body["messages"]
+            if message["role"] == "user"
+        ]
+
+
+@pytest.fixture
+def workflow() -> BlogPostGenerator:
+    return BlogPostGenerator(session_id=f"test-{uuid.uuid4().hex}")
+
+
+def scripted_agent(workflow: BlogPostGenerator, backend: ScriptedBackend, name: str = "topic_researcher"):
+    agent = getattr(workflow, name).deep_copy(update={"storage": None})
+    agent.model.client = OpenAI(
+        api_key="test",
+        base_url=FAKE_BASE_URL,
+        http_client=httpx.Client(transport=httpx.MockTransport(backend.handle)),
+    )
+    return agent
+
+
+@pytest.mark.parametrize(
+    "completion",
+    [
+        '{"title": "A", "summary": "S", "keywords": ["a", "b",],}',
+        'Here you go: {"title": "A", "summary": "S", "keywords": ["a", "b"]} hope it helps',
+        '```json\n{"title": "A", "summary": "S", "keywords": ["a", "b"\n```',
+    ],
+    ids=["trailing-commas", "surrounding-prose", "truncated"],
+)
+def test_malformed_completion_is_repaired_without_retry(workflow, completion):
+    backend = ScriptedBackend(completion)
+    agent = scripted_agent(workflow, backend)
+
+    topic = workflow.run_structured(agent, "Find a topic", BlogTopic)
+
+    assert topic == BlogTopic(title="A", summary="S", keywords=["a", "b"])
+    assert len(backend.requests) == 1
+    response_format = backend.requests[0]["response_format"]
+    assert response_format["type"] == "json_schema"
+    assert response_format["json_schema"]["strict"] is True
+
+
+def test_only_invalid_fields_are_asked_for_again_without_tools(workflow):
+    backend = ScriptedBackend(
+        '{"title": "A", "keywords": "a"}',
+        '{"summary": "S", "keywords": ["a"]}',
+    )
+    agent = scripted_agent(workflow, backend)
+
+    topic = workflow.run_structured(agent, "Find a topic about sqlite", BlogTopic)
+
+    assert topic == BlogTopic(title="A", summary="S", keywords=["a"])
+    first, retry = backend.requests
+    assert "tools" in first and "tools" not in retry
+    assert set(retry["response_format"]["json_schema"]["schema"]["properties"]) == {"summary", "keywords"}
+    retry_prompt = backend.user_prompts()[-1]
+    assert retry_prompt.startswith("Find a topic about sqlite")
+    assert '{"title": "A", "keywords": "a"}' in retry_prompt
+
+
+def test_only_invalid_items_are_asked_for_again(workflow):
+    backend = ScriptedBackend(
+        '{"references": [{"title": "A", "key_points": ["x"]}, {"url": "https://b.example"}]}',
+        '{"items": [{"title": "B", "url": "https://b.example", "key_points": ["y"]}]}',
+    )
+    agent = scripted_agent(workflow, backend, "research_assistant")
+
+    references = workflow.run_structured(agent, "Research sqlite", list[BlogReference])
+
+    assert [ref.title for ref in references] == ["A", "B"]
+    retry = backend.requests[1]
+    assert retry["response_format"]["json_schema"]["name"] == "BlogReferenceList"
+    assert "tools" not in retry
+    assert "item 1" in backend.user_prompts()[-1]
+
+
+def test_empty_completion_is_not_retried(workflow):
+    backend = ScriptedBackend("")
+    agent = scripted_agent(workflow, backend)
+
+    assert workflow.run_structured(agent, "Find a topic", BlogTopic) is None
+    assert len(backend.requests) == 1
+
+
+def test_repair_json_ignores_text_after_the_value():
+    assert repair_json('Here you go: {"a": [1, 2], "b": "}"} hope it helps {x}') == {"a": [1, 2], "b": "}"}
+    assert repair_json("Sure: [1, 2,] anything else?") == [1, 2]